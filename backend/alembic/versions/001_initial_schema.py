@@ -1,153 +0,0 @@
-"""Initial database schema.
-
-Revision ID: 001
-Revises:
-Create Date: 2026-01-16
-
-"""
-
-from collections.abc import Sequence
-
-import sqlalchemy as sa
-from alembic import op
-
-# revision identifiers, used by Alembic.
-revision: str = "001"
-down_revision: str | None = None
-branch_labels: str | Sequence[str] | None = None
-depends_on: str | Sequence[str] | None = None
-
-
-def upgrade() -> None:
-    # Create users table
-    op.create_table(
-        "users",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("email", sa.String(255), nullable=False),
-        sa.Column("hashed_password", sa.String(255), nullable=False),
-        sa.Column("full_name", sa.String(255), nullable=True),
-        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
-        sa.Column("is_superuser", sa.Boolean(), nullable=False, server_default="false"),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
-
-    # Create tours table
-    op.create_table(
-        "tours",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("civitatis_id", sa.Integer(), nullable=False),
-        sa.Column("name", sa.String(500), nullable=False),
-        sa.Column("url", sa.String(1000), nullable=True),
-        sa.Column("destination", sa.String(255), nullable=True),
-        sa.Column("destination_id", sa.Integer(), nullable=True),
-        sa.Column("category", sa.String(255), nullable=True),
-        sa.Column("currency", sa.String(3), nullable=False, server_default="EUR"),
-        sa.Column("current_price", sa.Numeric(10, 2), nullable=False),
-        sa.Column("rating", sa.Numeric(5, 2), nullable=True),
-        sa.Column(
-            "first_seen_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.Column(
-            "last_scraped_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
-        sa.Column("min_price", sa.Numeric(10, 2), nullable=True),
-        sa.Column("max_price", sa.Numeric(10, 2), nullable=True),
-        sa.Column("avg_price", sa.Numeric(10, 2), nullable=True),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(op.f("ix_tours_id"), "tours", ["id"], unique=False)
-    op.create_index(op.f("ix_tours_civitatis_id"), "tours", ["civitatis_id"], unique=True)
-    op.create_index(op.f("ix_tours_destination"), "tours", ["destination"], unique=False)
-    op.create_index(
-        "ix_tours_destination_category", "tours", ["destination", "category"], unique=False
-    )
-
-    # Create price_history table
-    op.create_table(
-        "price_history",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("tour_id", sa.Integer(), nullable=False),
-        sa.Column("price", sa.Numeric(10, 2), nullable=False),
-        sa.Column("currency", sa.String(3), nullable=False, server_default="EUR"),
-        sa.Column(
-            "recorded_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.Column("price_change", sa.Numeric(10, 2), nullable=True),
-        sa.Column("price_change_percent", sa.Numeric(5, 2), nullable=True),
-        sa.ForeignKeyConstraint(["tour_id"], ["tours.id"], ondelete="CASCADE"),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(op.f("ix_price_history_id"), "price_history", ["id"], unique=False)
-    op.create_index(op.f("ix_price_history_tour_id"), "price_history", ["tour_id"], unique=False)
-    op.create_index(
-        op.f("ix_price_history_recorded_at"), "price_history", ["recorded_at"], unique=False
-    )
-    op.create_index(
-        "ix_price_history_tour_recorded",
-        "price_history",
-        ["tour_id", "recorded_at"],
-        unique=False,
-    )
-
-    # Create alerts table
-    op.create_table(
-        "alerts",
-        sa.Column("id", sa.Integer(), nullable=False),
-        sa.Column("user_id", sa.Integer(), nullable=False),
-        sa.Column("tour_id", sa.Integer(), nullable=False),
-        sa.Column("alert_type", sa.String(50), nullable=False),
-        sa.Column("threshold_price", sa.Numeric(10, 2), nullable=True),
-        sa.Column("threshold_percentage", sa.Numeric(5, 2), nullable=True),
-        sa.Column("status", sa.String(20), nullable=False, server_default="active"),
-        sa.Column("last_triggered_at", sa.DateTime(timezone=True), nullable=True),
-        sa.Column("trigger_count", sa.Integer(), nullable=False, server_default="0"),
-        sa.Column(
-            "created_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.Column(
-            "updated_at",
-            sa.DateTime(timezone=True),
-            server_default=sa.text("now()"),
-            nullable=False,
-        ),
-        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
-        sa.ForeignKeyConstraint(["tour_id"], ["tours.id"], ondelete="CASCADE"),
-        sa.PrimaryKeyConstraint("id"),
-    )
-    op.create_index(op.f("ix_alerts_id"), "alerts", ["id"], unique=False)
-    op.create_index(op.f("ix_alerts_user_id"), "alerts", ["user_id"], unique=False)
-    op.create_index(op.f("ix_alerts_tour_id"), "alerts", ["tour_id"], unique=False)
-
-
-def downgrade() -> None:
-    op.drop_table("alerts")
-    op.drop_table("price_history")
-    op.drop_table("tours")
-    op.drop_table("users")
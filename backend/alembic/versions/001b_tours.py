@@ -0,0 +1,63 @@
+"""Create tours table.
+
+Part of the per-table split of the original big-bang 001 migration.
+
+Revision ID: 001b
+Revises: 001a
+Create Date: 2026-01-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "001b"
+down_revision: str | None = "001a"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tours",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("civitatis_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(500), nullable=False),
+        sa.Column("url", sa.String(1000), nullable=True),
+        sa.Column("destination", sa.String(255), nullable=True),
+        sa.Column("destination_id", sa.Integer(), nullable=True),
+        sa.Column("category", sa.String(255), nullable=True),
+        sa.Column("currency", sa.String(3), nullable=False, server_default="EUR"),
+        sa.Column("current_price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("rating", sa.Numeric(5, 2), nullable=True),
+        sa.Column(
+            "first_seen_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "last_scraped_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"),
+        sa.Column("min_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("max_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("avg_price", sa.Numeric(10, 2), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_tours_id"), "tours", ["id"], unique=False)
+    op.create_index(op.f("ix_tours_civitatis_id"), "tours", ["civitatis_id"], unique=True)
+    op.create_index(op.f("ix_tours_destination"), "tours", ["destination"], unique=False)
+    op.create_index(
+        "ix_tours_destination_category", "tours", ["destination", "category"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("tours")
@@ -0,0 +1,55 @@
+"""Create price_history table.
+
+Part of the per-table split of the original big-bang 001 migration.
+
+Revision ID: 001c
+Revises: 001b
+Create Date: 2026-01-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "001c"
+down_revision: str | None = "001b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "price_history",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("tour_id", sa.Integer(), nullable=False),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False, server_default="EUR"),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column("price_change", sa.Numeric(10, 2), nullable=True),
+        sa.Column("price_change_percent", sa.Numeric(5, 2), nullable=True),
+        sa.ForeignKeyConstraint(["tour_id"], ["tours.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_price_history_id"), "price_history", ["id"], unique=False)
+    op.create_index(op.f("ix_price_history_tour_id"), "price_history", ["tour_id"], unique=False)
+    op.create_index(
+        op.f("ix_price_history_recorded_at"), "price_history", ["recorded_at"], unique=False
+    )
+    op.create_index(
+        "ix_price_history_tour_recorded",
+        "price_history",
+        ["tour_id", "recorded_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("price_history")
@@ -0,0 +1,59 @@
+"""Create alerts table.
+
+Tail of the per-table split of the original big-bang 001 migration.
+Keeps revision id "001" so databases already stamped at 001 continue
+straight to 002 without intervention.
+
+Revision ID: 001
+Revises: 001c
+Create Date: 2026-01-16
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "001"
+down_revision: str | None = "001c"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "alerts",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("tour_id", sa.Integer(), nullable=False),
+        sa.Column("alert_type", sa.String(50), nullable=False),
+        sa.Column("threshold_price", sa.Numeric(10, 2), nullable=True),
+        sa.Column("threshold_percentage", sa.Numeric(5, 2), nullable=True),
+        sa.Column("status", sa.String(20), nullable=False, server_default="active"),
+        sa.Column("last_triggered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("trigger_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["tour_id"], ["tours.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(op.f("ix_alerts_id"), "alerts", ["id"], unique=False)
+    op.create_index(op.f("ix_alerts_user_id"), "alerts", ["user_id"], unique=False)
+    op.create_index(op.f("ix_alerts_tour_id"), "alerts", ["tour_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("alerts")
@@ -0,0 +1,36 @@
+"""Add composite index for the list_alerts query.
+
+`list_alerts` filters by user_id (+ optional status) and orders by
+created_at DESC; a matching composite index lets Postgres stream
+already-ordered rows for the LIMIT/OFFSET instead of sorting the
+user's full alert set per page.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_alerts_user_status_created",
+        "alerts",
+        ["user_id", "status", sa.text("created_at DESC")],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_user_status_created", table_name="alerts")
@@ -0,0 +1,44 @@
+"""Promote price_history(tour_id, recorded_at) to a covering index.
+
+Chart queries read (price, currency) for one tour ordered by time;
+adding INCLUDE columns lets Postgres satisfy them with an index-only
+scan instead of B-tree plus heap lookups. The single-column tour_id
+index is dropped as well — the composite's prefix already serves it.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_price_history_tour_recorded", table_name="price_history")
+    op.execute(
+        "CREATE INDEX ix_price_history_tour_recorded "
+        "ON price_history (tour_id, recorded_at DESC) INCLUDE (price, currency)"
+    )
+    op.drop_index("ix_price_history_tour_id", table_name="price_history")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_price_history_tour_id", "price_history", ["tour_id"], unique=False
+    )
+    op.drop_index("ix_price_history_tour_recorded", table_name="price_history")
+    op.create_index(
+        "ix_price_history_tour_recorded",
+        "price_history",
+        ["tour_id", "recorded_at"],
+        unique=False,
+    )
@@ -0,0 +1,33 @@
+"""Drop single-column indexes subsumed by composite prefixes.
+
+ix_tours_destination duplicates the leading column of
+ix_tours_destination_category, and ix_alerts_user_id duplicates the
+leading column of ix_alerts_user_status_created — the composites'
+prefixes serve the same lookups, so the singletons only add write
+amplification on the scraping hot path and waste buffer cache.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_tours_destination", table_name="tours")
+    op.drop_index("ix_alerts_user_id", table_name="alerts")
+
+
+def downgrade() -> None:
+    op.create_index("ix_alerts_user_id", "alerts", ["user_id"], unique=False)
+    op.create_index("ix_tours_destination", "tours", ["destination"], unique=False)
@@ -0,0 +1,42 @@
+"""Replace ix_notifications_user_id with a composite list index.
+
+The notification list reads WHERE user_id = ? (optionally is_read =
+false) ORDER BY sent_at DESC; a composite over exactly those columns
+serves both the page and the unread count, so the single-column
+user_id index only added write amplification on every alert fan-out.
+Built CONCURRENTLY inside an autocommit block so a live scraper is
+never blocked behind the index build.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_user_read_sent "
+            "ON notifications (user_id, is_read, sent_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_user_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_user_id "
+            "ON notifications (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_user_read_sent")
@@ -0,0 +1,36 @@
+"""Add partial unique index enforcing one active alert per type.
+
+create_alert's duplicate pre-check only ever looks at active rows, so
+a partial unique index over (user_id, tour_id, alert_type) WHERE
+status = 'active' is smaller and hotter in cache than a full index —
+and it turns the duplicate check into a DB-enforced guarantee, closing
+the race where two concurrent POSTs both pass the SELECT.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ux_alerts_active_dedup "
+            "ON alerts (user_id, tour_id, alert_type) WHERE status = 'active'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ux_alerts_active_dedup")
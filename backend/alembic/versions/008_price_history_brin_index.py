@@ -0,0 +1,41 @@
+"""Swap the recorded_at B-tree for a BRIN index on price_history.
+
+price_history is append-only and physically clustered by insert time,
+which is the ideal BRIN shape: the index stays orders of magnitude
+smaller than the B-tree while still serving "last N days" range scans
+(the cleanup job and stats windows). Point lookups per tour keep using
+the (tour_id, recorded_at DESC) composite.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008"
+down_revision: str | None = "007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_price_history_recorded_brin "
+            "ON price_history USING BRIN (recorded_at) WITH (pages_per_range = 64)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_price_history_recorded_at")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_price_history_recorded_at "
+            "ON price_history (recorded_at)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_price_history_recorded_brin")
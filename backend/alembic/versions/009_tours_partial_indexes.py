@@ -0,0 +1,57 @@
+"""Partial indexes for the active-tour hot paths.
+
+Every tours query filters on is_active, and the facet endpoints add
+IS NOT NULL, so partial indexes over just the active rows are both
+smaller and a better planner fit than full-table ones. Also adds a
+(user_id, sent_at DESC) index for the default notifications listing,
+which orders by sent_at without an is_read filter and so cannot use
+the (user_id, is_read, sent_at DESC) composite for its sort.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009"
+down_revision: str | None = "008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_active_destination "
+            "ON tours (destination) WHERE is_active AND destination IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_active_category "
+            "ON tours (category) WHERE is_active AND category IS NOT NULL"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_active_price "
+            "ON tours (current_price) WHERE is_active"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_last_scraped "
+            "ON tours (last_scraped_at DESC) WHERE is_active"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_user_sent "
+            "ON notifications (user_id, sent_at DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_notifications_user_sent")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_last_scraped")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_active_price")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_active_category")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_active_destination")
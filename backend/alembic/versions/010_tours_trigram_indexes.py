@@ -0,0 +1,41 @@
+"""Trigram GIN indexes for the tour search predicates.
+
+list_tours filters with unanchored ILIKE '%…%' patterns on name and
+destination, which a plain B-tree cannot serve, so every search was a
+sequential scan. pg_trgm GIN indexes accelerate those same ILIKE
+predicates with no route changes.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010"
+down_revision: str | None = "009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_name_trgm "
+            "ON tours USING GIN (name gin_trgm_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tours_destination_trgm "
+            "ON tours USING GIN (destination gin_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_destination_trgm")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tours_name_trgm")
@@ -0,0 +1,82 @@
+"""Store alert type/status as native PG enums instead of varchar.
+
+Enum values are 4 bytes on disk versus up to 50 for the varchar
+originals, which narrows alerts and notifications rows and makes the
+status/type equality filters cheaper. The dedup index is dropped and
+recreated around the column change so its predicate re-parses against
+the new type.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011"
+down_revision: str | None = "010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE TYPE alert_type_enum AS ENUM "
+        "('price_drop', 'price_increase', 'price_change', 'percentage_drop')"
+    )
+    op.execute(
+        "CREATE TYPE alert_status_enum AS ENUM "
+        "('active', 'triggered', 'paused', 'expired')"
+    )
+    op.execute("DROP INDEX IF EXISTS ux_alerts_active_dedup")
+    op.execute(
+        "ALTER TABLE alerts ALTER COLUMN alert_type TYPE alert_type_enum "
+        "USING alert_type::alert_type_enum"
+    )
+    # The varchar default 'active' (from 001d) cannot be recast
+    # automatically; drop it around the type change and restore it as
+    # an enum literal
+    op.execute("ALTER TABLE alerts ALTER COLUMN status DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE alerts ALTER COLUMN status TYPE alert_status_enum "
+        "USING status::alert_status_enum"
+    )
+    op.execute(
+        "ALTER TABLE alerts ALTER COLUMN status "
+        "SET DEFAULT 'active'::alert_status_enum"
+    )
+    op.execute(
+        "ALTER TABLE notifications ALTER COLUMN alert_type TYPE alert_type_enum "
+        "USING alert_type::alert_type_enum"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_alerts_active_dedup "
+        "ON alerts (user_id, tour_id, alert_type) WHERE status = 'active'"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ux_alerts_active_dedup")
+    op.execute(
+        "ALTER TABLE alerts ALTER COLUMN alert_type TYPE VARCHAR(50) "
+        "USING alert_type::text"
+    )
+    op.execute("ALTER TABLE alerts ALTER COLUMN status DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE alerts ALTER COLUMN status TYPE VARCHAR(20) USING status::text"
+    )
+    op.execute("ALTER TABLE alerts ALTER COLUMN status SET DEFAULT 'active'")
+    op.execute(
+        "ALTER TABLE notifications ALTER COLUMN alert_type TYPE VARCHAR(50) "
+        "USING alert_type::text"
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX ux_alerts_active_dedup "
+        "ON alerts (user_id, tour_id, alert_type) WHERE status = 'active'"
+    )
+    op.execute("DROP TYPE alert_status_enum")
+    op.execute("DROP TYPE alert_type_enum")
@@ -0,0 +1,34 @@
+"""Partial index for the scheduler's pending-alert sweep.
+
+check_all_pending_alerts now filters in SQL on active PRICE_DROP
+alerts joined to their tours; a partial (alert_type, tour_id) index
+over active rows turns that sweep into a narrow index range scan.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012"
+down_revision: str | None = "011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_active_type_tour "
+            "ON alerts (alert_type, tour_id) WHERE status = 'active'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_active_type_tour")
@@ -0,0 +1,36 @@
+"""Partial index for the per-tour active-alert lookup.
+
+check_alerts_for_tour runs WHERE tour_id = ? AND status = 'active' on
+every price change; the full tour_id index also carries every
+triggered/paused/expired row. A partial index over just the active
+rows stays small and hot in cache. The full index remains for FK
+cascade lookups.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013"
+down_revision: str | None = "012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_alerts_active_tour "
+            "ON alerts (tour_id) WHERE status = 'active'"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_active_tour")
@@ -0,0 +1,48 @@
+"""Add price_sample_count for incremental price statistics.
+
+_update_price_stats used to re-aggregate MIN/MAX/AVG over a tour's
+whole price history on every change, a scan that grows with the
+table. With a sample count stored on the tour, the stats become O(1)
+arithmetic (LEAST/GREATEST plus a running average). Existing rows are
+backfilled from their current history size.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-08-27
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014"
+down_revision: str | None = "013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tours",
+        sa.Column(
+            "price_sample_count",
+            sa.Integer(),
+            nullable=False,
+            server_default="1",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE tours SET price_sample_count = GREATEST(1, (
+            SELECT COUNT(*) FROM price_history
+            WHERE price_history.tour_id = tours.id
+        ))
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tours", "price_sample_count")
@@ -1,5 +1,8 @@
 """API dependencies for dependency injection."""
 
+import time
+from functools import lru_cache
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
@@ -12,15 +15,44 @@ from src.models import User
 security = HTTPBearer()
 
 
+@lru_cache(maxsize=4096)
+def _decode_token_cached(token: str) -> dict | None:
+    """Memoized JWT decode — the HMAC verify is pure in the token.
+
+    Expiry must be re-checked by the caller on every hit, since a
+    cached payload can outlive its own ``exp``.
+    """
+    return decode_token(token)
+
+
+# Short-lived User cache: amortizes the per-request SELECT for the
+# authenticated user under burst traffic. Invalidated on profile
+# changes (see auth.update_me).
+_USER_CACHE_TTL_SECONDS = 30.0
+_USER_CACHE_MAX_SIZE = 1024
+_user_cache: dict[int, tuple[float, User]] = {}
+
+
+def invalidate_user_cache(user_id: int) -> None:
+    """Drop a cached user after a profile update or deactivation."""
+    _user_cache.pop(user_id, None)
+
+
+def _cache_user(user: User) -> None:
+    if len(_user_cache) >= _USER_CACHE_MAX_SIZE:
+        _user_cache.clear()
+    _user_cache[user.id] = (time.monotonic() + _USER_CACHE_TTL_SECONDS, user)
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Get the current authenticated user from JWT token."""
     token = credentials.credentials
-    payload = decode_token(token)
+    payload = _decode_token_cached(token)
 
-    if payload is None:
+    if payload is None or payload.get("exp", 0) <= time.time():
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
@@ -42,8 +74,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    result = await db.execute(select(User).where(User.id == int(user_id)))
-    user = result.scalar_one_or_none()
+    cached = _user_cache.get(int(user_id))
+    if cached is not None and cached[0] > time.monotonic():
+        user = cached[1]
+    else:
+        result = await db.execute(select(User).where(User.id == int(user_id)))
+        user = result.scalar_one_or_none()
+        if user is not None:
+            _cache_user(user)
 
     if user is None:
         raise HTTPException(
@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.core.config import get_settings
 from src.utils.logger import get_logger, setup_logging
@@ -13,7 +14,7 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
-    from src.services import civitatis_scraper, scheduler_service
+    from src.services import close_civitatis_scraper, scheduler_service
 
     setup_logging(debug=settings.debug)
     logger.info(
@@ -29,13 +30,14 @@ async def lifespan(app: FastAPI):
     # Cleanup on shutdown
     logger.info("Shutting down Price Tracker API")
     scheduler_service.stop()
-    await civitatis_scraper.close()
+    await close_civitatis_scraper()
 
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
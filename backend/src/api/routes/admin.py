@@ -4,7 +4,9 @@ from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
 
 from src.api.dependencies import get_current_superuser
 from src.models import User
-from src.services import price_sync_service, scheduler_service
+
+# Service singletons (APScheduler, Playwright scraper) are imported
+# lazily inside handlers so importing the route module stays cheap
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
@@ -14,6 +16,8 @@ async def get_scheduler_status(
     current_user: User = Depends(get_current_superuser),
 ) -> dict:
     """Get scheduler status and job information."""
+    from src.services import scheduler_service
+
     return {
         "is_running": scheduler_service.is_running,
         "jobs": scheduler_service.get_jobs_info(),
@@ -27,6 +31,8 @@ async def trigger_sync(
     destination: str | None = None,
 ) -> dict:
     """Manually trigger a price sync job."""
+    from src.services import scheduler_service
+
     if not scheduler_service.is_running:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -54,9 +60,10 @@ async def trigger_sync(
 
 async def _sync_destination(destination: str) -> None:
     """Background task to sync a specific destination."""
-    from src.core.database import AsyncSessionLocal
+    from src.core.database import BackgroundSessionLocal
+    from src.services import price_sync_service
 
-    async with AsyncSessionLocal() as db:
+    async with BackgroundSessionLocal() as db:
         await price_sync_service.sync_destination(destination, db)
 
 
@@ -65,6 +72,8 @@ async def get_sync_destinations(
     current_user: User = Depends(get_current_superuser),
 ) -> dict:
     """Get list of destinations configured for sync."""
+    from src.services import price_sync_service
+
     return {
         "destinations": price_sync_service._destinations,
     }
@@ -76,6 +85,8 @@ async def set_sync_destinations(
     current_user: User = Depends(get_current_superuser),
 ) -> dict:
     """Set the list of destinations to sync."""
+    from src.services import price_sync_service
+
     price_sync_service.set_destinations(destinations)
     return {
         "status": "updated",
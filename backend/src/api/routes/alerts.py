@@ -1,12 +1,14 @@
 """Alert routes for CRUD operations."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from sqlalchemy import exists, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from src.api.dependencies import get_current_user
 from src.core.database import get_db
-from src.models import Alert, AlertStatus, Tour, User
+from src.models import Alert, AlertStatus, User
 from src.schemas import (
     AlertCreate,
     AlertListResponse,
@@ -18,6 +20,17 @@ from src.schemas import (
 router = APIRouter(prefix="/alerts", tags=["Alerts"])
 
 
+def _invalidate_alert_tour_cache() -> None:
+    """Tell the alert service a tour's subscription state changed.
+
+    Imported lazily so the routes module does not drag in the scraper
+    stack (same pattern as the admin routes).
+    """
+    from src.services import alert_service
+
+    alert_service.invalidate_tour_cache()
+
+
 @router.get("", response_model=AlertListResponse)
 async def list_alerts(
     db: AsyncSession = Depends(get_db),
@@ -27,22 +40,33 @@ async def list_alerts(
     status_filter: AlertStatus | None = None,
 ) -> AlertListResponse:
     """List all alerts for the current user."""
-    query = select(Alert).where(Alert.user_id == current_user.id)
-
+    filters = [Alert.user_id == current_user.id]
     if status_filter:
-        query = query.where(Alert.status == status_filter)
+        filters.append(Alert.status == status_filter)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
+    # Single round-trip: window count rides along with the page rows
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Alert.created_at.desc())
+    query = (
+        select(Alert, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Alert.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
 
     result = await db.execute(query)
-    alerts = result.scalars().all()
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif page == 1:
+        total = 0
+    else:
+        # Page ran past the end — direct indexed COUNT, no subquery
+        count_result = await db.execute(select(func.count(Alert.id)).where(*filters))
+        total = count_result.scalar() or 0
+
+    alerts = [row.Alert for row in rows]
 
     return AlertListResponse(
         items=[AlertResponse.model_validate(a) for a in alerts],
@@ -59,9 +83,12 @@ async def list_alerts_with_tours(
     status_filter: AlertStatus | None = None,
 ) -> list[AlertWithTourResponse]:
     """List all alerts with tour information."""
+    # Eager-load tours in one batched IN-list query; the identity map
+    # dedupes tours shared by several alerts instead of re-hydrating
+    # one Tour entity per joined row
     query = (
-        select(Alert, Tour)
-        .join(Tour, Alert.tour_id == Tour.id)
+        select(Alert)
+        .options(selectinload(Alert.tour))
         .where(Alert.user_id == current_user.id)
     )
 
@@ -71,7 +98,7 @@ async def list_alerts_with_tours(
     query = query.order_by(Alert.created_at.desc())
 
     result = await db.execute(query)
-    rows = result.all()
+    alerts = result.scalars().all()
 
     return [
         AlertWithTourResponse(
@@ -86,11 +113,11 @@ async def list_alerts_with_tours(
             trigger_count=alert.trigger_count,
             created_at=alert.created_at,
             updated_at=alert.updated_at,
-            tour_name=tour.name,
-            tour_current_price=tour.current_price,
-            tour_destination=tour.destination,
+            tour_name=alert.tour.name,
+            tour_current_price=alert.tour.current_price,
+            tour_destination=alert.tour.destination,
         )
-        for alert, tour in rows
+        for alert in alerts
     ]
 
 
@@ -124,28 +151,6 @@ async def create_alert(
     current_user: User = Depends(get_current_user),
 ) -> Alert:
     """Create a new price alert."""
-    # Verify tour exists
-    tour_result = await db.execute(select(Tour).where(Tour.id == alert_data.tour_id))
-    if not tour_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tour not found",
-        )
-
-    # Check if user already has an alert for this tour with same type
-    existing = await db.execute(
-        select(Alert)
-        .where(Alert.user_id == current_user.id)
-        .where(Alert.tour_id == alert_data.tour_id)
-        .where(Alert.alert_type == alert_data.alert_type)
-        .where(Alert.status == AlertStatus.ACTIVE)
-    )
-    if existing.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="You already have an active alert of this type for this tour",
-        )
-
     alert = Alert(
         user_id=current_user.id,
         tour_id=alert_data.tour_id,
@@ -154,8 +159,24 @@ async def create_alert(
         threshold_percentage=alert_data.threshold_percentage,
     )
     db.add(alert)
-    await db.commit()
-    await db.refresh(alert)
+
+    # No pre-check SELECTs: the tour FK and the ux_alerts_active_dedup
+    # partial unique index enforce both invariants race-free at INSERT
+    try:
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if "ux_alerts_active_dedup" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have an active alert of this type for this tour",
+            ) from e
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tour not found",
+        ) from e
+
+    _invalidate_alert_tour_cache()
 
     return alert
 
@@ -168,25 +189,47 @@ async def update_alert(
     current_user: User = Depends(get_current_user),
 ) -> Alert:
     """Update an alert."""
-    result = await db.execute(
-        select(Alert)
-        .where(Alert.id == alert_id)
-        .where(Alert.user_id == current_user.id)
-    )
-    alert = result.scalar_one_or_none()
-
-    if not alert:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Alert not found",
-        )
-
     update_data = alert_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(alert, field, value)
 
-    await db.commit()
-    await db.refresh(alert)
+    # Changing status or alert_type can collide with another ACTIVE
+    # alert under ux_alerts_active_dedup, same as create_alert
+    try:
+        if not update_data:
+            # Nothing to change — just return the current row
+            result = await db.execute(
+                select(Alert)
+                .where(Alert.id == alert_id)
+                .where(Alert.user_id == current_user.id)
+            )
+            alert = result.scalar_one_or_none()
+        else:
+            result = await db.execute(
+                update(Alert)
+                .where(Alert.id == alert_id)
+                .where(Alert.user_id == current_user.id)
+                .values(**update_data)
+                .returning(Alert)
+            )
+            alert = result.scalar_one_or_none()
+
+        if not alert:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Alert not found",
+            )
+
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if "ux_alerts_active_dedup" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have an active alert of this type for this tour",
+            ) from e
+        raise
+
+    if "status" in update_data:
+        _invalidate_alert_tour_cache()
 
     return alert
 
@@ -223,9 +266,11 @@ async def pause_alert(
 ) -> Alert:
     """Pause an alert."""
     result = await db.execute(
-        select(Alert)
+        update(Alert)
         .where(Alert.id == alert_id)
         .where(Alert.user_id == current_user.id)
+        .values(status=AlertStatus.PAUSED)
+        .returning(Alert)
     )
     alert = result.scalar_one_or_none()
 
@@ -235,9 +280,7 @@ async def pause_alert(
             detail="Alert not found",
         )
 
-    alert.status = AlertStatus.PAUSED
     await db.commit()
-    await db.refresh(alert)
 
     return alert
 
@@ -249,27 +292,48 @@ async def resume_alert(
     current_user: User = Depends(get_current_user),
 ) -> Alert:
     """Resume a paused alert."""
-    result = await db.execute(
-        select(Alert)
-        .where(Alert.id == alert_id)
-        .where(Alert.user_id == current_user.id)
-    )
-    alert = result.scalar_one_or_none()
-
-    if not alert:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Alert not found",
-        )
-
-    if alert.status != AlertStatus.PAUSED:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Alert is not paused",
+    # Resuming can collide with another ACTIVE alert of the same type
+    # under ux_alerts_active_dedup, same as create_alert
+    try:
+        result = await db.execute(
+            update(Alert)
+            .where(Alert.id == alert_id)
+            .where(Alert.user_id == current_user.id)
+            .where(Alert.status == AlertStatus.PAUSED)
+            .values(status=AlertStatus.ACTIVE)
+            .returning(Alert)
         )
-
-    alert.status = AlertStatus.ACTIVE
-    await db.commit()
-    await db.refresh(alert)
+        alert = result.scalar_one_or_none()
+
+        if not alert:
+            # Distinguish a missing alert from one that isn't paused
+            exists_result = await db.execute(
+                select(
+                    exists()
+                    .where(Alert.id == alert_id)
+                    .where(Alert.user_id == current_user.id)
+                )
+            )
+            if exists_result.scalar():
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Alert is not paused",
+                )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Alert not found",
+            )
+
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if "ux_alerts_active_dedup" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="You already have an active alert of this type for this tour",
+            ) from e
+        raise
+
+    _invalidate_alert_tour_cache()
 
     return alert
@@ -1,10 +1,10 @@
 """Authentication routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.api.dependencies import get_current_user
+from src.api.dependencies import get_current_user, invalidate_user_cache
 from src.core.database import get_db
 from src.core.security import (
     create_access_token,
@@ -36,12 +36,11 @@ async def register(
     # Create new user
     user = User(
         email=user_data.email,
-        hashed_password=get_password_hash(user_data.password),
+        hashed_password=await get_password_hash(user_data.password),
         full_name=user_data.full_name,
     )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
 
     return user
 
@@ -55,7 +54,7 @@ async def login(
     result = await db.execute(select(User).where(User.email == login_data.email))
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(login_data.password, user.hashed_password):
+    if not user or not await verify_password(login_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -119,13 +118,27 @@ async def update_me(
     db: AsyncSession = Depends(get_db),
 ) -> User:
     """Update current user profile."""
+    values: dict = {}
     if user_data.full_name is not None:
-        current_user.full_name = user_data.full_name
+        values["full_name"] = user_data.full_name
 
     if user_data.password is not None:
-        current_user.hashed_password = get_password_hash(user_data.password)
-
+        values["hashed_password"] = await get_password_hash(user_data.password)
+
+    if not values:
+        return current_user
+
+    # current_user may come from the dependency's TTL cache (detached),
+    # so write via an explicit UPDATE instead of mutating the instance
+    result = await db.execute(
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**values)
+        .returning(User)
+    )
+    user = result.scalar_one()
     await db.commit()
-    await db.refresh(current_user)
 
-    return current_user
+    invalidate_user_cache(user.id)
+
+    return user
@@ -1,78 +1,129 @@
 """Notification routes for viewing alert notifications."""
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select, update
+from pydantic import TypeAdapter
+from sqlalchemy import delete, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from src.api.dependencies import get_current_user
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.models import Notification, Tour, User
 from src.schemas import (
     NotificationListResponse,
     NotificationResponse,
     NotificationWithTourResponse,
 )
+from src.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/notifications", tags=["Notifications"])
 
+# Validates a whole page in one call into pydantic-core instead of
+# re-entering model_validate per row
+_notification_list_adapter = TypeAdapter(list[NotificationResponse])
+
 
 @router.get("", response_model=NotificationListResponse)
 async def list_notifications(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     unread_only: bool = False,
+    cursor: str | None = Query(None),
 ) -> NotificationListResponse:
-    """List notifications for the current user."""
-    query = select(Notification).where(Notification.user_id == current_user.id)
+    """List notifications for the current user.
+
+    Pass the ``next_cursor`` from a previous response to page by
+    keyset instead of offset.
+    """
+    filters = [Notification.user_id == current_user.id]
 
     if unread_only:
-        query = query.where(Notification.is_read == False)  # noqa: E712
+        filters.append(Notification.is_read == False)  # noqa: E712
+
+    if cursor is not None:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        filters.append(tuple_(Notification.sent_at, Notification.id) < decoded)
+
+    # Single round-trip: total and unread counts ride along with the
+    # page rows as window aggregates
+    query = (
+        select(
+            Notification,
+            func.count().over().label("total"),
+            func.count()
+            .filter(Notification.is_read == False)  # noqa: E712
+            .over()
+            .label("unread_count"),
+        )
+        .where(*filters)
+        .order_by(Notification.sent_at.desc(), Notification.id.desc())
+        .limit(page_size + 1)
+    )
+    if cursor is None:
+        query = query.offset((page - 1) * page_size)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    result = await db.execute(query)
+    rows = result.all()
 
-    # Get unread count
-    unread_query = (
-        select(func.count())
-        .where(Notification.user_id == current_user.id)
-        .where(Notification.is_read == False)  # noqa: E712
-    )
-    unread_result = await db.execute(unread_query)
-    unread_count = unread_result.scalar() or 0
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if rows:
+        total = rows[0].total
+        unread_count = rows[0].unread_count
+    else:
+        # Empty page (or one past the end) — one small indexed query
+        # answers both counts
+        count_result = await db.execute(
+            select(
+                func.count().label("total"),
+                func.count()
+                .filter(Notification.is_read == False)  # noqa: E712
+                .label("unread_count"),
+            ).where(*filters)
+        )
+        total, unread_count = count_result.one()
 
-    # Apply pagination
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Notification.sent_at.desc())
+    notifications = [row.Notification for row in rows]
 
-    result = await db.execute(query)
-    notifications = result.scalars().all()
+    next_cursor = None
+    if has_more and notifications:
+        last = notifications[-1]
+        next_cursor = encode_cursor(last.sent_at, last.id)
 
     return NotificationListResponse(
-        items=[NotificationResponse.model_validate(n) for n in notifications],
+        items=_notification_list_adapter.validate_python(notifications),
         total=total,
         page=page,
         page_size=page_size,
         unread_count=unread_count,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/with-tours", response_model=list[NotificationWithTourResponse])
 async def list_notifications_with_tours(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
     limit: int = Query(50, ge=1, le=100),
     unread_only: bool = False,
 ) -> list[NotificationWithTourResponse]:
     """List notifications with tour information."""
+    # selectinload fetches each distinct tour once via a secondary
+    # IN (...) query, instead of the join repeating every tour column
+    # per notification row; load_only trims it to the two fields the
+    # response actually uses
     query = (
-        select(Notification, Tour)
-        .join(Tour, Notification.tour_id == Tour.id)
+        select(Notification)
         .where(Notification.user_id == current_user.id)
+        .options(selectinload(Notification.tour).load_only(Tour.name, Tour.destination))
     )
 
     if unread_only:
@@ -81,7 +132,7 @@ async def list_notifications_with_tours(
     query = query.order_by(Notification.sent_at.desc()).limit(limit)
 
     result = await db.execute(query)
-    rows = result.all()
+    notifications = result.scalars().all()
 
     return [
         NotificationWithTourResponse(
@@ -97,17 +148,17 @@ async def list_notifications_with_tours(
             message=notification.message,
             is_read=notification.is_read,
             sent_at=notification.sent_at,
-            tour_name=tour.name,
-            tour_destination=tour.destination,
+            tour_name=notification.tour.name,
+            tour_destination=notification.tour.destination,
         )
-        for notification, tour in rows
+        for notification in notifications
     ]
 
 
 @router.get("/{notification_id}", response_model=NotificationResponse)
 async def get_notification(
     notification_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_current_user),
 ) -> Notification:
     """Get a specific notification."""
@@ -134,10 +185,14 @@ async def mark_as_read(
     current_user: User = Depends(get_current_user),
 ) -> Notification:
     """Mark a notification as read."""
+    # Single UPDATE ... RETURNING: the WHERE doubles as the ownership
+    # check, so no pre-select is needed to produce the 404
     result = await db.execute(
-        select(Notification)
+        update(Notification)
         .where(Notification.id == notification_id)
         .where(Notification.user_id == current_user.id)
+        .values(is_read=True)
+        .returning(Notification)
     )
     notification = result.scalar_one_or_none()
 
@@ -147,9 +202,7 @@ async def mark_as_read(
             detail="Notification not found",
         )
 
-    notification.is_read = True
     await db.commit()
-    await db.refresh(notification)
 
     return notification
 
@@ -160,17 +213,23 @@ async def mark_all_as_read(
     current_user: User = Depends(get_current_user),
 ) -> dict:
     """Mark all notifications as read."""
+    # RETURNING streams the changed ids back with the UPDATE itself,
+    # so there is no rowcount fetch and the client can invalidate
+    # exactly the notifications that flipped
     result = await db.execute(
         update(Notification)
         .where(Notification.user_id == current_user.id)
         .where(Notification.is_read == False)  # noqa: E712
         .values(is_read=True)
+        .returning(Notification.id)
     )
+    changed_ids = [row[0] for row in result.all()]
     await db.commit()
 
     return {
         "status": "success",
-        "marked_as_read": result.rowcount,
+        "marked_as_read": len(changed_ids),
+        "ids": changed_ids,
     }
 
 
@@ -182,17 +241,17 @@ async def delete_notification(
 ) -> None:
     """Delete a notification."""
     result = await db.execute(
-        select(Notification)
+        delete(Notification)
         .where(Notification.id == notification_id)
         .where(Notification.user_id == current_user.id)
+        .returning(Notification.id)
     )
-    notification = result.scalar_one_or_none()
+    deleted_id = result.scalar_one_or_none()
 
-    if not notification:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Notification not found",
         )
 
-    await db.delete(notification)
     await db.commit()
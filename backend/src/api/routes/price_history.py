@@ -3,120 +3,178 @@
 from datetime import datetime, timedelta, timezone
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, select
+from pydantic import TypeAdapter
+from sqlalchemy import exists, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_read_db
 from src.models import PriceHistory, Tour
 from src.schemas import PriceHistoryListResponse, PriceHistoryResponse, PriceStatsResponse
+from src.utils.pagination import decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/tours/{tour_id}/prices", tags=["Price History"])
 
+# Validates a whole page in one call into pydantic-core instead of
+# re-entering model_validate per row
+_price_history_list_adapter = TypeAdapter(list[PriceHistoryResponse])
+
 
 @router.get("", response_model=PriceHistoryListResponse)
 async def list_price_history(
     tour_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=200),
     days: int | None = Query(None, ge=1, le=365),
+    cursor: str | None = Query(None),
 ) -> PriceHistoryListResponse:
-    """Get price history for a tour."""
-    # Verify tour exists
-    tour_result = await db.execute(select(Tour).where(Tour.id == tour_id))
-    if not tour_result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tour not found",
-        )
+    """Get price history for a tour.
 
-    query = select(PriceHistory).where(PriceHistory.tour_id == tour_id)
+    Pass the ``next_cursor`` from a previous response to page by
+    keyset instead of offset — deep pages then cost O(page_size)
+    instead of scanning past every earlier row.
+    """
+    filters = [PriceHistory.tour_id == tour_id]
 
     # Filter by date range if specified
     if days:
         cutoff = datetime.now(timezone.utc) - timedelta(days=days)
-        query = query.where(PriceHistory.recorded_at >= cutoff)
-
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+        filters.append(PriceHistory.recorded_at >= cutoff)
+
+    if cursor is not None:
+        decoded = decode_cursor(cursor)
+        if decoded is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        # Keyset: the composite (tour_id, recorded_at) index walks
+        # straight to the boundary, no offset scan
+        filters.append(
+            tuple_(PriceHistory.recorded_at, PriceHistory.id) < decoded
+        )
 
-    # Apply pagination and ordering
-    offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(PriceHistory.recorded_at.desc())
+    # Single round-trip: window count rides along with the page rows
+    query = (
+        select(PriceHistory, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(PriceHistory.recorded_at.desc(), PriceHistory.id.desc())
+        .limit(page_size + 1)
+    )
+    if cursor is None:
+        query = query.offset((page - 1) * page_size)
 
     result = await db.execute(query)
-    history = result.scalars().all()
+    rows = result.all()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+
+    if rows:
+        # Any history row implies the tour exists (FK), so no
+        # separate tour pre-check round-trip is needed
+        total = rows[0].total
+    else:
+        # Empty page: one aggregate query settles both "does the tour
+        # exist" (404) and the real count in a single round-trip
+        count_result = await db.execute(
+            select(
+                func.count(PriceHistory.id).label("total"),
+                exists(select(Tour.id).where(Tour.id == tour_id)).label("tour_exists"),
+            ).where(*filters)
+        )
+        total, tour_exists = count_result.one()
+        if not tour_exists:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tour not found",
+            )
+
+    history = [row.PriceHistory for row in rows]
+
+    next_cursor = None
+    if has_more and history:
+        last = history[-1]
+        next_cursor = encode_cursor(last.recorded_at, last.id)
 
     return PriceHistoryListResponse(
-        items=[PriceHistoryResponse.model_validate(h) for h in history],
+        items=_price_history_list_adapter.validate_python(history),
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/stats", response_model=PriceStatsResponse)
 async def get_price_stats(
     tour_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PriceStatsResponse:
     """Get price statistics for a tour."""
-    # Get tour
-    tour_result = await db.execute(select(Tour).where(Tour.id == tour_id))
-    tour = tour_result.scalar_one_or_none()
-
-    if not tour:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Tour not found",
-        )
-
-    # Get total records
-    count_query = select(func.count()).where(PriceHistory.tour_id == tour_id)
-    count_result = await db.execute(count_query)
-    total_records = count_result.scalar() or 0
-
-    # Calculate price changes
     now = datetime.now(timezone.utc)
 
-    async def get_price_change(days: int):
+    def oldest_price_since(days: int):
+        """Oldest in-window price, as a scalar subquery."""
         cutoff = now - timedelta(days=days)
-        query = (
+        return (
             select(PriceHistory.price)
             .where(PriceHistory.tour_id == tour_id)
             .where(PriceHistory.recorded_at >= cutoff)
             .order_by(PriceHistory.recorded_at.asc())
             .limit(1)
+            .scalar_subquery()
         )
-        result = await db.execute(query)
-        old_price = result.scalar_one_or_none()
-        if old_price and tour.current_price:
-            return tour.current_price - old_price
-        return None
 
-    price_change_24h = await get_price_change(1)
-    price_change_7d = await get_price_change(7)
-    price_change_30d = await get_price_change(30)
+    # One statement answers everything: selecting from tours folds the
+    # existence check (zero rows means 404) and the cached aggregates
+    # into the same round-trip, while each scalar subquery is a LIMIT 1
+    # walk of the covering (tour_id, recorded_at) index
+    stats_result = await db.execute(
+        select(
+            Tour.current_price,
+            Tour.min_price,
+            Tour.max_price,
+            Tour.avg_price,
+            oldest_price_since(1).label("price_1d"),
+            oldest_price_since(7).label("price_7d"),
+            oldest_price_since(30).label("price_30d"),
+            select(func.count())
+            .where(PriceHistory.tour_id == tour_id)
+            .scalar_subquery()
+            .label("total_records"),
+        ).where(Tour.id == tour_id)
+    )
+    row = stats_result.one_or_none()
+
+    if row is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tour not found",
+        )
+
+    def change_from(old_price):
+        if old_price and row.current_price:
+            return row.current_price - old_price
+        return None
 
     return PriceStatsResponse(
         tour_id=tour_id,
-        current_price=tour.current_price,
-        min_price=tour.min_price,
-        max_price=tour.max_price,
-        avg_price=tour.avg_price,
-        price_change_24h=price_change_24h,
-        price_change_7d=price_change_7d,
-        price_change_30d=price_change_30d,
-        total_records=total_records,
+        current_price=row.current_price,
+        min_price=row.min_price,
+        max_price=row.max_price,
+        avg_price=row.avg_price,
+        price_change_24h=change_from(row.price_1d),
+        price_change_7d=change_from(row.price_7d),
+        price_change_30d=change_from(row.price_30d),
+        total_records=row.total_records or 0,
     )
 
 
 @router.get("/latest", response_model=PriceHistoryResponse)
 async def get_latest_price(
     tour_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> PriceHistory:
     """Get the latest price record for a tour."""
     query = (
@@ -1,21 +1,67 @@
 """Tour routes for CRUD operations and search."""
 
+import time
 from decimal import Decimal
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func, or_, select
+from pydantic import TypeAdapter
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.core.database import get_db
+from src.core.database import get_db, get_read_db
 from src.models import Tour
 from src.schemas import TourCreate, TourListResponse, TourResponse, TourUpdate
 
 router = APIRouter(prefix="/tours", tags=["Tours"])
 
+# Validates a whole page in one call into pydantic-core instead of
+# re-entering model_validate per row
+_tour_list_adapter = TypeAdapter(list[TourResponse])
+
+# The distinct destination/category sets only change when the scraper
+# (or an admin) adds a tour, so serve them from a small in-process TTL
+# cache instead of running a DISTINCT sort over tours per request
+_FACET_CACHE_TTL_SECONDS = 300.0
+_facet_cache: dict[str, tuple[float, list[str]]] = {}
+
+
+def _facet_cache_get(key: str) -> list[str] | None:
+    entry = _facet_cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _facet_cache_set(key: str, values: list[str]) -> None:
+    _facet_cache[key] = (time.monotonic() + _FACET_CACHE_TTL_SECONDS, values)
+
+
+def _facet_cache_invalidate() -> None:
+    _facet_cache.clear()
+
+
+def _tour_insert_values(tour_data: TourCreate) -> dict:
+    """Column values for inserting a new tour, stats seeded from the price."""
+    return {
+        "civitatis_id": tour_data.civitatis_id,
+        "name": tour_data.name,
+        "current_price": tour_data.current_price,
+        "currency": tour_data.currency,
+        "url": tour_data.url,
+        "destination": tour_data.destination,
+        "destination_id": tour_data.destination_id,
+        "category": tour_data.category,
+        "rating": tour_data.rating,
+        "min_price": tour_data.current_price,
+        "max_price": tour_data.current_price,
+        "avg_price": tour_data.current_price,
+    }
+
 
 @router.get("", response_model=TourListResponse)
 async def list_tours(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     destination: str | None = None,
@@ -26,39 +72,51 @@ async def list_tours(
     is_active: bool = True,
 ) -> TourListResponse:
     """List tours with filtering and pagination."""
-    query = select(Tour).where(Tour.is_active == is_active)
+    filters = [Tour.is_active == is_active]
 
     # Apply filters
     if destination:
-        query = query.where(Tour.destination.ilike(f"%{destination}%"))
+        filters.append(Tour.destination.ilike(f"%{destination}%"))
     if category:
-        query = query.where(Tour.category.ilike(f"%{category}%"))
+        filters.append(Tour.category.ilike(f"%{category}%"))
     if min_price is not None:
-        query = query.where(Tour.current_price >= min_price)
+        filters.append(Tour.current_price >= min_price)
     if max_price is not None:
-        query = query.where(Tour.current_price <= max_price)
+        filters.append(Tour.current_price <= max_price)
     if search:
-        query = query.where(
+        filters.append(
             or_(
                 Tour.name.ilike(f"%{search}%"),
                 Tour.destination.ilike(f"%{search}%"),
             )
         )
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Apply pagination
+    # Single round-trip: window count rides along with the page rows
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size).order_by(Tour.last_scraped_at.desc())
+    query = (
+        select(Tour, func.count().over().label("total"))
+        .where(*filters)
+        .order_by(Tour.last_scraped_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
 
     result = await db.execute(query)
-    tours = result.scalars().all()
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif page == 1:
+        total = 0
+    else:
+        # Page ran past the end — fall back to a direct COUNT
+        count_result = await db.execute(select(func.count(Tour.id)).where(*filters))
+        total = count_result.scalar() or 0
+
+    tours = [row.Tour for row in rows]
 
     return TourListResponse(
-        items=[TourResponse.model_validate(t) for t in tours],
+        items=_tour_list_adapter.validate_python(tours),
         total=total,
         page=page,
         page_size=page_size,
@@ -68,9 +126,13 @@ async def list_tours(
 
 @router.get("/destinations", response_model=list[str])
 async def list_destinations(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[str]:
     """Get list of unique destinations."""
+    cached = _facet_cache_get("destinations")
+    if cached is not None:
+        return cached
+
     query = (
         select(Tour.destination)
         .where(Tour.destination.isnot(None))
@@ -79,14 +141,20 @@ async def list_destinations(
         .order_by(Tour.destination)
     )
     result = await db.execute(query)
-    return [r[0] for r in result.all()]
+    destinations = list(result.scalars().all())
+    _facet_cache_set("destinations", destinations)
+    return destinations
 
 
 @router.get("/categories", response_model=list[str])
 async def list_categories(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> list[str]:
     """Get list of unique categories."""
+    cached = _facet_cache_get("categories")
+    if cached is not None:
+        return cached
+
     query = (
         select(Tour.category)
         .where(Tour.category.isnot(None))
@@ -95,13 +163,15 @@ async def list_categories(
         .order_by(Tour.category)
     )
     result = await db.execute(query)
-    return [r[0] for r in result.all()]
+    categories = list(result.scalars().all())
+    _facet_cache_set("categories", categories)
+    return categories
 
 
 @router.get("/{tour_id}", response_model=TourResponse)
 async def get_tour(
     tour_id: int,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> Tour:
     """Get a specific tour by ID."""
     result = await db.execute(select(Tour).where(Tour.id == tour_id))
@@ -122,39 +192,69 @@ async def create_tour(
     db: AsyncSession = Depends(get_db),
 ) -> Tour:
     """Create a new tour (usually called by scraper)."""
-    # Check if civitatis_id already exists
+    # ON CONFLICT DO NOTHING makes the duplicate check part of the
+    # insert itself: one round-trip, race-safe against concurrent
+    # scraper calls
     result = await db.execute(
-        select(Tour).where(Tour.civitatis_id == tour_data.civitatis_id)
+        pg_insert(Tour)
+        .values(**_tour_insert_values(tour_data))
+        .on_conflict_do_nothing(index_elements=["civitatis_id"])
+        .returning(Tour)
     )
-    existing = result.scalar_one_or_none()
+    tour = result.scalar_one_or_none()
 
-    if existing:
+    if not tour:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Tour with civitatis_id {tour_data.civitatis_id} already exists",
         )
 
-    tour = Tour(
-        civitatis_id=tour_data.civitatis_id,
-        name=tour_data.name,
-        current_price=tour_data.current_price,
-        currency=tour_data.currency,
-        url=tour_data.url,
-        destination=tour_data.destination,
-        destination_id=tour_data.destination_id,
-        category=tour_data.category,
-        rating=tour_data.rating,
-        min_price=tour_data.current_price,
-        max_price=tour_data.current_price,
-        avg_price=tour_data.current_price,
-    )
-    db.add(tour)
     await db.commit()
-    await db.refresh(tour)
+
+    _facet_cache_invalidate()
 
     return tour
 
 
+@router.post("/bulk", response_model=dict, status_code=status.HTTP_201_CREATED)
+async def bulk_upsert_tours(
+    tours_data: list[TourCreate],
+    db: AsyncSession = Depends(get_db),
+) -> dict:
+    """Create or refresh many tours in one statement (scraper sync path)."""
+    if not tours_data:
+        return {"status": "success", "upserted": 0}
+
+    # Deduplicate: a repeated civitatis_id would make ON CONFLICT DO
+    # UPDATE fail with "cannot affect row a second time" (last one wins,
+    # same as _sync_tours_bulk)
+    by_cid = {t.civitatis_id: t for t in tours_data}
+
+    stmt = pg_insert(Tour).values([_tour_insert_values(t) for t in by_cid.values()])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["civitatis_id"],
+        set_={
+            "name": stmt.excluded.name,
+            "current_price": stmt.excluded.current_price,
+            "currency": stmt.excluded.currency,
+            "url": stmt.excluded.url,
+            "destination": stmt.excluded.destination,
+            "destination_id": stmt.excluded.destination_id,
+            "category": stmt.excluded.category,
+            "rating": stmt.excluded.rating,
+            "last_scraped_at": func.now(),
+        },
+    ).returning(Tour.id)
+
+    result = await db.execute(stmt)
+    upserted = len(result.all())
+    await db.commit()
+
+    _facet_cache_invalidate()
+
+    return {"status": "success", "upserted": upserted}
+
+
 @router.patch("/{tour_id}", response_model=TourResponse)
 async def update_tour(
     tour_id: int,
@@ -162,7 +262,26 @@ async def update_tour(
     db: AsyncSession = Depends(get_db),
 ) -> Tour:
     """Update a tour."""
-    result = await db.execute(select(Tour).where(Tour.id == tour_id))
+    update_data = tour_data.model_dump(exclude_unset=True)
+
+    if not update_data:
+        result = await db.execute(select(Tour).where(Tour.id == tour_id))
+        tour = result.scalar_one_or_none()
+        if not tour:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Tour not found",
+            )
+        return tour
+
+    # Single UPDATE ... RETURNING: missing ids surface as zero rows,
+    # so no pre-select is needed to produce the 404
+    result = await db.execute(
+        update(Tour)
+        .where(Tour.id == tour_id)
+        .values(**update_data)
+        .returning(Tour)
+    )
     tour = result.scalar_one_or_none()
 
     if not tour:
@@ -171,12 +290,9 @@ async def update_tour(
             detail="Tour not found",
         )
 
-    update_data = tour_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(tour, field, value)
-
     await db.commit()
-    await db.refresh(tour)
+
+    _facet_cache_invalidate()
 
     return tour
 
@@ -187,14 +303,20 @@ async def delete_tour(
     db: AsyncSession = Depends(get_db),
 ) -> None:
     """Delete a tour (soft delete by setting is_active=False)."""
-    result = await db.execute(select(Tour).where(Tour.id == tour_id))
-    tour = result.scalar_one_or_none()
+    result = await db.execute(
+        update(Tour)
+        .where(Tour.id == tour_id)
+        .values(is_active=False)
+        .returning(Tour.id)
+    )
+    deleted_id = result.scalar_one_or_none()
 
-    if not tour:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tour not found",
         )
 
-    tour.is_active = False
     await db.commit()
+
+    _facet_cache_invalidate()
@@ -17,6 +17,11 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "postgresql+asyncpg://postgres:postgres@db:5432/pricetracker"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_background_pool_size: int = 4
 
     # Security
     secret_key: str = "your-secret-key-change-in-production"
@@ -30,9 +35,11 @@ class Settings(BaseSettings):
     # Scraping
     scrape_rate_limit_seconds: int = 30
     scrape_max_retries: int = 3
+    scrape_concurrency: int = 4
 
     # Scheduler
     sync_prices_interval_hours: int = 6
+    sync_concurrency: int = 4
     sync_tours_interval_hours: int = 24
     cleanup_days_to_keep: int = 90
 
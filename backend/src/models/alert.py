@@ -4,7 +4,8 @@ from datetime import datetime
 from decimal import Decimal
 from enum import Enum
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, func, text
+from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -28,6 +29,24 @@ class AlertStatus(str, Enum):
     EXPIRED = "expired"
 
 
+# Native PG enums: 4-byte values instead of varchar per row, and the
+# values (not the Python member names) are what lands in the database.
+# alert_type_enum is shared with the notifications table.
+alert_type_enum = SQLEnum(
+    AlertType,
+    name="alert_type_enum",
+    native_enum=True,
+    values_callable=lambda e: [m.value for m in e],
+)
+
+alert_status_enum = SQLEnum(
+    AlertStatus,
+    name="alert_status_enum",
+    native_enum=True,
+    values_callable=lambda e: [m.value for m in e],
+)
+
+
 class Alert(Base):
     """Price alert configuration for a tour."""
 
@@ -35,19 +54,21 @@ class Alert(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     tour_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("tours.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Alert configuration
-    alert_type: Mapped[AlertType] = mapped_column(String(50), nullable=False)
+    alert_type: Mapped[AlertType] = mapped_column(alert_type_enum, nullable=False)
     threshold_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
     threshold_percentage: Mapped[Decimal | None] = mapped_column(Numeric(5, 2), nullable=True)
 
     # Alert state
-    status: Mapped[AlertStatus] = mapped_column(String(20), default=AlertStatus.ACTIVE)
+    status: Mapped[AlertStatus] = mapped_column(
+        alert_status_enum, default=AlertStatus.ACTIVE
+    )
     last_triggered_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -65,5 +86,32 @@ class Alert(Base):
     user: Mapped["User"] = relationship("User", back_populates="alerts")  # noqa: F821
     tour: Mapped["Tour"] = relationship("Tour", back_populates="alerts")  # noqa: F821
 
+    __table_args__ = (
+        Index("ix_alerts_user_status_created", "user_id", "status", text("created_at DESC")),
+        Index(
+            "ux_alerts_active_dedup",
+            "user_id",
+            "tour_id",
+            "alert_type",
+            unique=True,
+            postgresql_where=text("status = 'active'"),
+        ),
+        # Serves the scheduler's pending-alert sweep, which scans
+        # active alerts by type and joins tours by tour_id
+        Index(
+            "ix_alerts_active_type_tour",
+            "alert_type",
+            "tour_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+        # The hottest alert lookup: active alerts for one tour on
+        # every price change; tiny because it only covers active rows
+        Index(
+            "ix_alerts_active_tour",
+            "tour_id",
+            postgresql_where=text("status = 'active'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Alert(id={self.id}, type={self.alert_type}, status={self.status})>"
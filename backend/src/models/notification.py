@@ -3,10 +3,11 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Integer, Numeric, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
+from src.models.alert import alert_type_enum
 
 
 class Notification(Base):
@@ -19,7 +20,7 @@ class Notification(Base):
         Integer, ForeignKey("alerts.id", ondelete="CASCADE"), nullable=False, index=True
     )
     user_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
     tour_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("tours.id", ondelete="CASCADE"), nullable=False, index=True
@@ -32,7 +33,7 @@ class Notification(Base):
     price_change_percent: Mapped[Decimal] = mapped_column(Numeric(5, 2), nullable=False)
 
     # Alert details
-    alert_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    alert_type: Mapped[str] = mapped_column(alert_type_enum, nullable=False)
     message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Status
@@ -46,5 +47,10 @@ class Notification(Base):
     user: Mapped["User"] = relationship("User")  # noqa: F821
     tour: Mapped["Tour"] = relationship("Tour")  # noqa: F821
 
+    __table_args__ = (
+        Index("ix_notifications_user_read_sent", "user_id", "is_read", text("sent_at DESC")),
+        Index("ix_notifications_user_sent", "user_id", text("sent_at DESC")),
+    )
+
     def __repr__(self) -> str:
         return f"<Notification(id={self.id}, alert_id={self.alert_id}, user_id={self.user_id})>"
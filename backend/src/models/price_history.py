@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, Numeric, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -16,12 +16,12 @@ class PriceHistory(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     tour_id: Mapped[int] = mapped_column(
-        Integer, ForeignKey("tours.id", ondelete="CASCADE"), nullable=False, index=True
+        Integer, ForeignKey("tours.id", ondelete="CASCADE"), nullable=False
     )
     price: Mapped[Decimal] = mapped_column(Numeric(10, 2), nullable=False)
     currency: Mapped[str] = mapped_column(default="EUR")
     recorded_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Price change from previous record
@@ -32,7 +32,18 @@ class PriceHistory(Base):
     tour: Mapped["Tour"] = relationship("Tour", back_populates="price_history")  # noqa: F821
 
     __table_args__ = (
-        Index("ix_price_history_tour_recorded", "tour_id", "recorded_at"),
+        Index(
+            "ix_price_history_tour_recorded",
+            "tour_id",
+            text("recorded_at DESC"),
+            postgresql_include=["price", "currency"],
+        ),
+        Index(
+            "ix_price_history_recorded_brin",
+            "recorded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 64},
+        ),
     )
 
     def __repr__(self) -> str:
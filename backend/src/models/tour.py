@@ -3,7 +3,7 @@
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import DateTime, Index, Integer, Numeric, String, Text, func
+from sqlalchemy import DateTime, Index, Integer, Numeric, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.core.database import Base
@@ -18,7 +18,7 @@ class Tour(Base):
     civitatis_id: Mapped[int] = mapped_column(Integer, unique=True, index=True, nullable=False)
     name: Mapped[str] = mapped_column(String(500), nullable=False)
     url: Mapped[str | None] = mapped_column(String(1000), nullable=True)
-    destination: Mapped[str | None] = mapped_column(String(255), nullable=True, index=True)
+    destination: Mapped[str | None] = mapped_column(String(255), nullable=True)
     destination_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
     category: Mapped[str | None] = mapped_column(String(255), nullable=True)
     currency: Mapped[str] = mapped_column(String(3), default="EUR")
@@ -36,10 +36,14 @@ class Tour(Base):
     )
     is_active: Mapped[bool] = mapped_column(default=True)
 
-    # Price statistics (computed from history)
+    # Price statistics, maintained incrementally on each price change
     min_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
     max_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
     avg_price: Mapped[Decimal | None] = mapped_column(Numeric(10, 2), nullable=True)
+    # Number of price samples behind avg_price (the running average)
+    price_sample_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, server_default="1"
+    )
 
     # Relationships
     price_history: Mapped[list["PriceHistory"]] = relationship(  # noqa: F821
@@ -51,6 +55,42 @@ class Tour(Base):
 
     __table_args__ = (
         Index("ix_tours_destination_category", "destination", "category"),
+        # Partial indexes over the active rows that the list/facet
+        # endpoints actually touch; soft-deleted tours stay out of them
+        Index(
+            "ix_tours_active_destination",
+            "destination",
+            postgresql_where=text("is_active AND destination IS NOT NULL"),
+        ),
+        Index(
+            "ix_tours_active_category",
+            "category",
+            postgresql_where=text("is_active AND category IS NOT NULL"),
+        ),
+        Index(
+            "ix_tours_active_price",
+            "current_price",
+            postgresql_where=text("is_active"),
+        ),
+        Index(
+            "ix_tours_last_scraped",
+            text("last_scraped_at DESC"),
+            postgresql_where=text("is_active"),
+        ),
+        # Trigram GIN indexes so the unanchored ILIKE '%…%' search
+        # predicates become index probes instead of sequential scans
+        Index(
+            "ix_tours_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tours_destination_trgm",
+            "destination",
+            postgresql_using="gin",
+            postgresql_ops={"destination": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
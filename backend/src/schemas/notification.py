@@ -40,3 +40,4 @@ class NotificationListResponse(BaseModel):
     page: int
     page_size: int
     unread_count: int
+    next_cursor: str | None = None
@@ -33,12 +33,18 @@ class PriceHistoryResponse(PriceHistoryBase):
 
 
 class PriceHistoryListResponse(BaseModel):
-    """Schema for paginated price history list."""
+    """Schema for paginated price history list.
+
+    When paging by cursor, ``total`` counts the rows from the cursor
+    onward and ``next_cursor`` resumes the next page; it is None on
+    the last page or in offset mode.
+    """
 
     items: list[PriceHistoryResponse]
     total: int
     page: int
     page_size: int
+    next_cursor: str | None = None
 
 
 class PriceStatsResponse(BaseModel):
@@ -1,9 +1,41 @@
-"""Services module - contains business logic."""
+"""Services module - contains business logic.
 
-from src.services.alert_service import AlertNotification, AlertService, alert_service
-from src.services.civitatis_scraper import CivitatisScraper, TourData, civitatis_scraper
-from src.services.price_sync import PriceSyncService, price_sync_service
-from src.services.scheduler import SchedulerService, run_initial_sync, scheduler_service
+Attributes resolve lazily (PEP 562): importing one service no longer
+pays the import cost of the others' dependency stacks (playwright and
+BeautifulSoup for the scraper, APScheduler for the scheduler).
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from src.services.alert_service import AlertNotification, AlertService, alert_service
+    from src.services.civitatis_scraper import (
+        CivitatisScraper,
+        TourData,
+        civitatis_scraper,
+        close_civitatis_scraper,
+        get_civitatis_scraper,
+    )
+    from src.services.price_sync import PriceSyncService, price_sync_service
+    from src.services.scheduler import SchedulerService, run_initial_sync, scheduler_service
+
+# Submodule providing each public name, imported on first access
+_LAZY_ATTRS = {
+    "AlertNotification": "src.services.alert_service",
+    "AlertService": "src.services.alert_service",
+    "alert_service": "src.services.alert_service",
+    "CivitatisScraper": "src.services.civitatis_scraper",
+    "TourData": "src.services.civitatis_scraper",
+    "civitatis_scraper": "src.services.civitatis_scraper",
+    "get_civitatis_scraper": "src.services.civitatis_scraper",
+    "close_civitatis_scraper": "src.services.civitatis_scraper",
+    "PriceSyncService": "src.services.price_sync",
+    "price_sync_service": "src.services.price_sync",
+    "SchedulerService": "src.services.scheduler",
+    "run_initial_sync": "src.services.scheduler",
+    "scheduler_service": "src.services.scheduler",
+}
 
 __all__ = [
     "AlertNotification",
@@ -12,9 +44,21 @@ __all__ = [
     "CivitatisScraper",
     "TourData",
     "civitatis_scraper",
+    "get_civitatis_scraper",
+    "close_civitatis_scraper",
     "PriceSyncService",
     "price_sync_service",
     "SchedulerService",
     "scheduler_service",
     "run_initial_sync",
 ]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    # Cache so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
@@ -3,24 +3,50 @@
 Monitors price changes and triggers alerts based on user configurations.
 """
 
+import asyncio
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager, joinedload
 
-from src.core.database import AsyncSessionLocal
+from src.core.database import BackgroundSessionLocal
 from src.models import Alert, AlertStatus, AlertType, Notification, Tour, User
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
-@dataclass
+def _cents(price: Decimal) -> int:
+    """Exact integer cents for a 2-dp Numeric price."""
+    return int(price * 100)
+
+
+# Format strings are parsed once here instead of on every notification
+_DB_MESSAGE_FMT = (
+    "Il prezzo del tour '{name}' è cambiato da €{old_price:.2f} a €{new_price:.2f}"
+).format
+_EMAIL_SUBJECT_FMT = "Price Alert: {name}".format
+_EMAIL_BODY_FMT = (
+    "Il prezzo del tour '{name}' è cambiato!\n\n"
+    "Prezzo precedente: €{old_price:.2f}\n"
+    "Nuovo prezzo: €{new_price:.2f}\n"
+    "Variazione: €{price_change:.2f} "
+    "({price_change_percent:.1f}%)\n\n"
+    "Tipo alert: {alert_type}\n"
+).format
+
+
+@dataclass(slots=True, frozen=True)
 class AlertNotification:
-    """Represents a triggered alert notification."""
+    """Represents a triggered alert notification.
+
+    Built once per triggered alert on the hot path, so it is slotted
+    (no per-instance __dict__) and immutable.
+    """
 
     alert_id: int
     user_id: int
@@ -54,16 +80,56 @@ class AlertNotification:
         }
 
 
+# How long the set of tour ids with active alerts may be served from
+# memory before being re-read
+_ALERT_TOURS_TTL_SECONDS = 60.0
+
+
 class AlertService:
     """Service for managing and triggering price alerts."""
 
     def __init__(self):
         self._notification_handlers: list = []
+        self._alert_tour_ids: set[int] | None = None
+        self._alert_tour_ids_expiry = 0.0
+        # Single dict lookup per alert instead of walking an enum
+        # comparison ladder
+        self._trigger_dispatch = {
+            AlertType.PRICE_DROP: self._trig_price_drop,
+            AlertType.PRICE_INCREASE: self._trig_price_increase,
+            AlertType.PRICE_CHANGE: self._trig_price_change,
+            AlertType.PERCENTAGE_DROP: self._trig_percentage_drop,
+        }
 
     def add_notification_handler(self, handler) -> None:
         """Add a handler to be called when alerts are triggered."""
         self._notification_handlers.append(handler)
 
+    def invalidate_tour_cache(self) -> None:
+        """Drop the cached set of tour ids with active alerts.
+
+        Called by the alert routes whenever an alert is created or
+        resumed, so a new subscription is seen on the next check.
+        """
+        self._alert_tour_ids = None
+
+    async def _tour_has_active_alerts(self, tour_id: int, db: AsyncSession) -> bool:
+        """O(1) membership test against a TTL-cached set of tour ids.
+
+        Most price updates hit tours nobody subscribed to; one DISTINCT
+        scan per TTL window replaces a per-update existence query.
+        """
+        now = time.monotonic()
+        if self._alert_tour_ids is None or now >= self._alert_tour_ids_expiry:
+            result = await db.execute(
+                select(Alert.tour_id)
+                .where(Alert.status == AlertStatus.ACTIVE)
+                .distinct()
+            )
+            self._alert_tour_ids = set(result.scalars().all())
+            self._alert_tour_ids_expiry = now + _ALERT_TOURS_TTL_SECONDS
+        return tour_id in self._alert_tour_ids
+
     async def check_alerts_for_tour(
         self,
         tour_id: int,
@@ -86,126 +152,176 @@ class AlertService:
         if old_price == new_price:
             return []
 
-        price_change = new_price - old_price
-        price_change_percent = (
-            (price_change / old_price * 100) if old_price > 0 else Decimal(0)
+        # Cheap short-circuit before any per-tour query
+        if not await self._tour_has_active_alerts(tour_id, db):
+            return []
+
+        # All arithmetic runs on int cents and a float percentage —
+        # Decimal division is arbitrary-precision and far slower than
+        # the ~0.01% resolution the thresholds need
+        old_cents = _cents(old_price)
+        new_cents = _cents(new_price)
+        change_percent = (
+            (new_cents - old_cents) * 100.0 / old_cents if old_cents > 0 else 0.0
         )
 
-        # Get tour info
-        tour_result = await db.execute(select(Tour).where(Tour.id == tour_id))
-        tour = tour_result.scalar_one_or_none()
-        if not tour:
-            return []
+        # Decimal values are only materialized for the stored
+        # notification fields
+        price_change = new_price - old_price
+        price_change_percent = Decimal(str(round(change_percent, 4)))
 
-        # Get all active alerts for this tour with user info
+        # One query fetches the active alerts, the owner's email (the
+        # only User column this path reads) and the tour riding along
+        # on joins — and when no alerts exist (the common case for
+        # long-tail tours) we return without ever fetching the tour
         alerts_query = (
-            select(Alert)
-            .options(selectinload(Alert.user))
+            select(Alert, User.email)
+            .join(User, User.id == Alert.user_id)
+            .options(joinedload(Alert.tour))
             .where(Alert.tour_id == tour_id)
             .where(Alert.status == AlertStatus.ACTIVE)
         )
         result = await db.execute(alerts_query)
-        alerts = result.scalars().all()
+        alert_rows = result.all()
+
+        if not alert_rows:
+            return []
+
+        tour = alert_rows[0].Alert.tour
+
+        # Alerts triggered by one price change are logically
+        # simultaneous — stamp the whole batch once
+        triggered_at = datetime.now(timezone.utc)
 
         triggered_notifications = []
+        triggered_alert_ids = []
 
-        for alert in alerts:
+        for alert, user_email in alert_rows:
             should_trigger = self._should_trigger_alert(
                 alert=alert,
-                old_price=old_price,
-                new_price=new_price,
-                price_change=price_change,
-                price_change_percent=price_change_percent,
+                old_cents=old_cents,
+                new_cents=new_cents,
+                change_percent=change_percent,
             )
 
             if should_trigger:
+                # Resolve the enum (and its .value descriptor) once per
+                # triggered alert instead of in each consumer below
+                alert_type = alert.alert_type
                 notification = AlertNotification(
                     alert_id=alert.id,
                     user_id=alert.user_id,
-                    user_email=alert.user.email,
+                    user_email=user_email,
                     tour_id=tour_id,
                     tour_name=tour.name,
-                    alert_type=alert.alert_type,
+                    alert_type=alert_type,
                     old_price=old_price,
                     new_price=new_price,
                     price_change=price_change,
                     price_change_percent=price_change_percent,
                     threshold_price=alert.threshold_price,
                     threshold_percentage=alert.threshold_percentage,
-                    triggered_at=datetime.now(timezone.utc),
+                    triggered_at=triggered_at,
                 )
                 triggered_notifications.append(notification)
-
-                # Update alert status
-                await self._mark_alert_triggered(alert.id, db)
+                triggered_alert_ids.append(alert.id)
 
                 logger.info(
                     "Alert triggered",
                     alert_id=alert.id,
-                    user_email=alert.user.email,
+                    user_email=user_email,
                     tour_name=tour.name[:50],
-                    alert_type=alert.alert_type.value,
+                    alert_type=alert_type.value,
                     old_price=float(old_price),
                     new_price=float(new_price),
                 )
 
-        # Send notifications
+        # One bulk status update for the whole batch, then send; the
+        # notification rows join the caller's transaction
         if triggered_notifications:
-            await self._send_notifications(triggered_notifications)
+            await self._mark_alerts_triggered(triggered_alert_ids, db, triggered_at)
+            await self._send_notifications(triggered_notifications, db)
 
         return triggered_notifications
 
     def _should_trigger_alert(
         self,
         alert: Alert,
-        old_price: Decimal,
-        new_price: Decimal,
-        price_change: Decimal,
-        price_change_percent: Decimal,
+        old_cents: int,
+        new_cents: int,
+        change_percent: float,
     ) -> bool:
-        """Determine if an alert should be triggered based on its type."""
-
-        if alert.alert_type == AlertType.PRICE_DROP:
-            # Trigger when price drops below threshold
-            return (
-                new_price < old_price
-                and alert.threshold_price is not None
-                and new_price <= alert.threshold_price
-            )
+        """Determine if an alert should be triggered based on its type.
 
-        elif alert.alert_type == AlertType.PRICE_INCREASE:
-            # Trigger when price increases above threshold
-            return (
-                new_price > old_price
-                and alert.threshold_price is not None
-                and new_price >= alert.threshold_price
-            )
+        Runs once per alert per price change, so the comparisons work
+        on int cents and a float percentage rather than Decimal, and
+        the per-type predicate resolves through one dict lookup.
+        """
+        predicate = self._trigger_dispatch.get(alert.alert_type)
+        if predicate is None:
+            return False
+        return predicate(alert, old_cents, new_cents, change_percent)
+
+    @staticmethod
+    def _trig_price_drop(
+        alert: Alert, old_cents: int, new_cents: int, change_percent: float
+    ) -> bool:
+        """Trigger when price drops below threshold."""
+        return (
+            new_cents < old_cents
+            and alert.threshold_price is not None
+            and new_cents <= _cents(alert.threshold_price)
+        )
 
-        elif alert.alert_type == AlertType.PRICE_CHANGE:
-            # Trigger on any price change
-            return new_price != old_price
+    @staticmethod
+    def _trig_price_increase(
+        alert: Alert, old_cents: int, new_cents: int, change_percent: float
+    ) -> bool:
+        """Trigger when price increases above threshold."""
+        return (
+            new_cents > old_cents
+            and alert.threshold_price is not None
+            and new_cents >= _cents(alert.threshold_price)
+        )
 
-        elif alert.alert_type == AlertType.PERCENTAGE_DROP:
-            # Trigger when price drops by specified percentage
-            return (
-                price_change < 0
-                and alert.threshold_percentage is not None
-                and abs(price_change_percent) >= alert.threshold_percentage
-            )
+    @staticmethod
+    def _trig_price_change(
+        alert: Alert, old_cents: int, new_cents: int, change_percent: float
+    ) -> bool:
+        """Trigger on any price change."""
+        return new_cents != old_cents
 
-        return False
+    @staticmethod
+    def _trig_percentage_drop(
+        alert: Alert, old_cents: int, new_cents: int, change_percent: float
+    ) -> bool:
+        """Trigger when price drops by the configured percentage."""
+        return (
+            change_percent < 0
+            and alert.threshold_percentage is not None
+            and abs(change_percent) >= float(alert.threshold_percentage)
+        )
 
-    async def _mark_alert_triggered(
+    async def _mark_alerts_triggered(
         self,
-        alert_id: int,
+        alert_ids: list[int],
         db: AsyncSession,
+        triggered_at: datetime,
     ) -> None:
-        """Update alert status after being triggered."""
+        """Update alert status for a batch of triggered alerts.
+
+        One UPDATE ... WHERE id IN (...) regardless of how many alerts
+        fired, instead of a round-trip per alert; the batch shares one
+        last_triggered_at value.
+        """
+        if not alert_ids:
+            return
+
         await db.execute(
             update(Alert)
-            .where(Alert.id == alert_id)
+            .where(Alert.id.in_(alert_ids))
             .values(
-                last_triggered_at=datetime.now(timezone.utc),
+                last_triggered_at=triggered_at,
                 trigger_count=Alert.trigger_count + 1,
             )
         )
@@ -213,33 +329,32 @@ class AlertService:
     async def _send_notifications(
         self,
         notifications: list[AlertNotification],
+        db: AsyncSession | None = None,
     ) -> None:
-        """Send notifications through registered handlers."""
-        for handler in self._notification_handlers:
-            try:
-                await handler(notifications)
-            except Exception as e:
-                logger.error(f"Notification handler error: {e}")
+        """Send notifications through registered handlers.
+
+        When the caller already holds a session, the notification rows
+        ride its transaction and commit — no extra pool checkout.
+        """
+        # Handlers do independent I/O (email, push, webhooks) — run
+        # them concurrently so batch latency is the slowest handler,
+        # not the sum
+        results = await asyncio.gather(
+            *(handler(notifications) for handler in self._notification_handlers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Notification handler error: {result}")
 
         # Always log notifications
         for notification in notifications:
-            await self._log_notification(notification)
+            self._log_notification(notification)
 
-    async def _log_notification(self, notification: AlertNotification) -> None:
-        """Log a notification and save to database."""
-        logger.info(
-            "Alert notification",
-            alert_id=notification.alert_id,
-            user_email=notification.user_email,
-            tour_name=notification.tour_name[:50],
-            alert_type=notification.alert_type.value,
-            price_change=float(notification.price_change),
-            price_change_percent=float(notification.price_change_percent),
-        )
-
-        # Save notification to database
-        async with AsyncSessionLocal() as db:
-            db_notification = Notification(
+        # Persist the whole batch in one session instead of a
+        # transaction per notification
+        rows = [
+            Notification(
                 alert_id=notification.alert_id,
                 user_id=notification.user_id,
                 tour_id=notification.tour_id,
@@ -248,13 +363,33 @@ class AlertService:
                 price_change=notification.price_change,
                 price_change_percent=notification.price_change_percent,
                 alert_type=notification.alert_type.value,
-                message=(
-                    f"Il prezzo del tour '{notification.tour_name}' è cambiato da "
-                    f"€{notification.old_price:.2f} a €{notification.new_price:.2f}"
+                message=_DB_MESSAGE_FMT(
+                    name=notification.tour_name,
+                    old_price=notification.old_price,
+                    new_price=notification.new_price,
                 ),
             )
-            db.add(db_notification)
-            await db.commit()
+            for notification in notifications
+        ]
+
+        if db is not None:
+            db.add_all(rows)
+        else:
+            async with BackgroundSessionLocal() as session:
+                session.add_all(rows)
+                await session.commit()
+
+    def _log_notification(self, notification: AlertNotification) -> None:
+        """Log a triggered notification."""
+        logger.info(
+            "Alert notification",
+            alert_id=notification.alert_id,
+            user_email=notification.user_email,
+            tour_name=notification.tour_name[:50],
+            alert_type=notification.alert_type.value,
+            price_change=float(notification.price_change),
+            price_change_percent=float(notification.price_change_percent),
+        )
 
     async def check_all_pending_alerts(self) -> dict:
         """
@@ -270,48 +405,65 @@ class AlertService:
             "errors": 0,
         }
 
-        async with AsyncSessionLocal() as db:
-            # Get all active alerts with tour info
+        async with BackgroundSessionLocal() as db:
+            count_result = await db.execute(
+                select(func.count(Alert.id)).where(Alert.status == AlertStatus.ACTIVE)
+            )
+            stats["alerts_checked"] = count_result.scalar() or 0
+
+            # The threshold comparison runs in the database: only
+            # PRICE_DROP alerts whose tour already sits at or below
+            # threshold come back, instead of hydrating every active
+            # alert and filtering in Python
             alerts_query = (
-                select(Alert)
-                .options(selectinload(Alert.user), selectinload(Alert.tour))
+                select(Alert, User.email)
+                .join(Tour, Tour.id == Alert.tour_id)
+                .join(User, User.id == Alert.user_id)
+                .options(contains_eager(Alert.tour))
                 .where(Alert.status == AlertStatus.ACTIVE)
+                .where(Alert.alert_type == AlertType.PRICE_DROP)
+                .where(Alert.threshold_price.isnot(None))
+                .where(Tour.current_price <= Alert.threshold_price)
             )
             result = await db.execute(alerts_query)
-            alerts = result.scalars().all()
+            alert_rows = result.all()
+
+            triggered_at = datetime.now(timezone.utc)
 
-            for alert in alerts:
-                stats["alerts_checked"] += 1
+            triggered_notifications = []
+            triggered_alert_ids = []
+
+            for alert, user_email in alert_rows:
                 try:
-                    # For PRICE_DROP alerts, check if current price is below threshold
-                    if (
-                        alert.alert_type == AlertType.PRICE_DROP
-                        and alert.threshold_price is not None
-                        and alert.tour.current_price <= alert.threshold_price
-                    ):
-                        notification = AlertNotification(
-                            alert_id=alert.id,
-                            user_id=alert.user_id,
-                            user_email=alert.user.email,
-                            tour_id=alert.tour_id,
-                            tour_name=alert.tour.name,
-                            alert_type=alert.alert_type,
-                            old_price=alert.threshold_price,
-                            new_price=alert.tour.current_price,
-                            price_change=alert.tour.current_price - alert.threshold_price,
-                            price_change_percent=Decimal(0),
-                            threshold_price=alert.threshold_price,
-                            threshold_percentage=alert.threshold_percentage,
-                            triggered_at=datetime.now(timezone.utc),
-                        )
-                        await self._mark_alert_triggered(alert.id, db)
-                        await self._send_notifications([notification])
-                        stats["alerts_triggered"] += 1
+                    notification = AlertNotification(
+                        alert_id=alert.id,
+                        user_id=alert.user_id,
+                        user_email=user_email,
+                        tour_id=alert.tour_id,
+                        tour_name=alert.tour.name,
+                        alert_type=alert.alert_type,
+                        old_price=alert.threshold_price,
+                        new_price=alert.tour.current_price,
+                        price_change=alert.tour.current_price - alert.threshold_price,
+                        price_change_percent=Decimal(0),
+                        threshold_price=alert.threshold_price,
+                        threshold_percentage=alert.threshold_percentage,
+                        triggered_at=triggered_at,
+                    )
+                    triggered_notifications.append(notification)
+                    triggered_alert_ids.append(alert.id)
+                    stats["alerts_triggered"] += 1
 
                 except Exception as e:
                     logger.error(f"Error checking alert {alert.id}: {e}")
                     stats["errors"] += 1
 
+            # One bulk status update and one send for the whole sweep;
+            # a single commit covers both the alert updates and the
+            # notification rows
+            await self._mark_alerts_triggered(triggered_alert_ids, db, triggered_at)
+            if triggered_notifications:
+                await self._send_notifications(triggered_notifications, db)
             await db.commit()
 
         logger.info(
@@ -339,14 +491,14 @@ async def email_notification_handler(notifications: list[AlertNotification]) ->
     for notification in notifications:
         email_content = {
             "to": notification.user_email,
-            "subject": f"Price Alert: {notification.tour_name[:50]}",
-            "body": (
-                f"Il prezzo del tour '{notification.tour_name}' è cambiato!\n\n"
-                f"Prezzo precedente: €{notification.old_price:.2f}\n"
-                f"Nuovo prezzo: €{notification.new_price:.2f}\n"
-                f"Variazione: €{notification.price_change:.2f} "
-                f"({notification.price_change_percent:.1f}%)\n\n"
-                f"Tipo alert: {notification.alert_type.value}\n"
+            "subject": _EMAIL_SUBJECT_FMT(name=notification.tour_name[:50]),
+            "body": _EMAIL_BODY_FMT(
+                name=notification.tour_name,
+                old_price=notification.old_price,
+                new_price=notification.new_price,
+                price_change=notification.price_change,
+                price_change_percent=notification.price_change_percent,
+                alert_type=notification.alert_type.value,
             ),
         }
         logger.info(
@@ -12,11 +12,14 @@ the actual visible prices from HTML elements.
 import asyncio
 import json
 import re
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
 
+import httpx
+import orjson
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 from tenacity import retry, stop_after_attempt, wait_exponential
 
@@ -26,10 +29,173 @@ from src.utils.logger import get_logger
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Settled-DOM detection: the page counts as loaded once no tracked
+# network request has been inflight for the quiet window; requests
+# stuck longer than the stall threshold are dropped from tracking
+_SETTLE_QUIET_SECONDS = 0.5
+_SETTLE_STALL_SECONDS = 2.0
+_SETTLE_POLL_SECONDS = 0.05
+
+# Fetches a pooled page may serve before it is closed and replaced
+_PAGE_RECYCLE_USES = 50
+
+# Recycle the browser context after this many fetches or this much
+# wall-clock time, whichever comes first; Chromium contexts accumulate
+# RSS across navigations even with per-page recycling
+_CONTEXT_RECYCLE_PAGES = 200
+_CONTEXT_RECYCLE_SECONDS = 1800.0
+
+# How long a destination's scraped tour list is served from memory;
+# overlapping sync runs within this window share one scrape
+_DEST_CACHE_TTL_SECONDS = 600.0
+
+# Hot-path regexes, compiled once at import; these run per card and
+# per page rather than per scrape
+# Price patterns: "From €59", "A partire da €59", "Desde 59 €"
+_RE_CARD_PRICES = [
+    re.compile(r'(?:From|A partire da|Desde)\s*[€$£]\s*(\d+(?:[.,]\d{2})?)', re.IGNORECASE),
+    re.compile(r'(?:From|A partire da|Desde)\s*(\d+(?:[.,]\d{2})?)\s*[€$£]', re.IGNORECASE),
+    re.compile(r'[€$£]\s*(\d+(?:[.,]\d{2})?)\s*(?:per person|a persona)?', re.IGNORECASE),
+]
+_RE_NON_NUMERIC = re.compile(r'[^\d.,]')
+# GTMData anchors, tried with a C-level find() plus raw_decode; the
+# regexes remain only as a cleanup fallback for malformed JSON
+_GTM_ANCHORS = ("var GTMData", "GTMData", "dataLayer.push(")
+_JSON_DECODER = json.JSONDecoder()
+_RE_GTM_DATA = [
+    re.compile(r'var\s+GTMData\s*=\s*({.*?});', re.DOTALL),
+    re.compile(r'GTMData\s*=\s*({.*?});', re.DOTALL),
+    re.compile(r'dataLayer\.push\(({.*?"ecommerce".*?})\)', re.DOTALL),
+]
+_RE_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+_RE_TOUR_NAME = re.compile(r'"name":\s*"([^"]+)"')
+_RE_TOUR_ID = re.compile(r'"id":\s*(\d+)')
+_RE_FROM_PRICE = re.compile(r'(?:From|A partire da)\s*[€$£]\s*(\d+(?:[.,]\d{2})?)')
+_RE_GTM_PRICE = re.compile(r'"price":\s*([\d.]+)')
+
+def _parse_price_cents(text: str) -> int | None:
+    """Parse price text like "59", "59.90" or "€ 59,90" into int cents.
+
+    The card loop runs once per card per page; int math here keeps
+    Decimal construction to one per accepted tour at the TourData
+    boundary.
+    """
+    digits = _RE_NON_NUMERIC.sub('', text).replace(',', '.')
+    if not digits:
+        return None
+
+    if '.' in digits:
+        intpart, _, fracpart = digits.rpartition('.')
+        # A 3+ digit tail is a thousands separator, not cents
+        if len(fracpart) > 2:
+            intpart, fracpart = intpart + fracpart, ''
+        intpart = intpart.replace('.', '')
+    else:
+        intpart, fracpart = digits, ''
+
+    try:
+        return int(intpart or '0') * 100 + int(fracpart.ljust(2, '0') or '0')
+    except ValueError:
+        return None
+
+
+# Card extractor installed once per document via add_init_script;
+# per-page evaluation then ships only the call, not the function body
+_EXTRACT_CARDS_INIT_JS = """
+window.__civitatisExtract = () => {
+    const cards = document.querySelectorAll(
+        'article.comfort-card, .o-search-list__item, [data-gtm-click]'
+    );
+    return Array.from(cards).map((card) => {
+        const link =
+            card.querySelector(
+                "a[href*='/en/'], a[href*='/it/'], a[href*='/es/']"
+            ) || card.querySelector('a');
+        const priceEl = card.querySelector(
+            '.comfort-card__price__current, ' +
+            '.m-activity-card__price, ' +
+            '.a-activity-card__price-current'
+        );
+        return {
+            href: link ? link.getAttribute('href') : null,
+            priceText: priceEl ? priceEl.textContent : null,
+            cardText: card.textContent || '',
+        };
+    });
+};
+"""
+
+# Finds and clicks the cookie-banner accept button entirely in-page,
+# so dismissal is one evaluate() round-trip with no actionability
+# wait when no banner is present. Returns whether anything was clicked.
+_DISMISS_COOKIES_JS = """
+() => {
+    const sels = ['#onetrust-accept-btn-handler', "[class*='cookie'] button"];
+    for (const s of sels) {
+        const el = document.querySelector(s);
+        if (el) { el.click(); return true; }
+    }
+    for (const b of document.querySelectorAll('button')) {
+        if (/\\b(accept|aceptar)\\b/i.test(b.textContent || '')) {
+            b.click();
+            return true;
+        }
+    }
+    return false;
+}
+"""
+
+# Pulls a tour detail page's id/name/price from the live GTMData
+# object plus the first matching displayed-price element, in a single
+# evaluate() round-trip. Body text is only materialized when no price
+# element matched, for the "From €XX" text fallback.
+_EXTRACT_DETAIL_JS = """
+() => {
+    const ecommerce = (window.GTMData && window.GTMData.ecommerce) || {};
+    const detail = (ecommerce.detail && ecommerce.detail.products
+        && ecommerce.detail.products[0]) || null;
+
+    const sels = [
+        '.m-activity-info__price-container .price',
+        '.o-activity-price__amount',
+        "[class*='price'] [class*='amount']",
+        '.m-activity-card__price',
+        "span[class*='Price']",
+    ];
+    let priceText = null;
+    for (const s of sels) {
+        const el = document.querySelector(s);
+        if (el && el.textContent) { priceText = el.textContent; break; }
+    }
+
+    return {
+        id: detail ? detail.id : null,
+        name: detail ? detail.name : null,
+        gtmPrice: detail ? detail.price : null,
+        priceText,
+        bodyText: priceText ? null : (document.body ? document.body.textContent : null),
+    };
+}
+"""
+
+# Resources that never contribute to GTMData or displayed price text;
+# aborting them cuts most of the bytes per page load
+_BLOCKED_RESOURCE_TYPES = {"image", "font", "media", "stylesheet"}
+_BLOCKED_HOSTS = (
+    "googletagmanager.com",
+    "google-analytics.com",
+    "facebook.net",
+    "hotjar.com",
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class TourData:
-    """Structured tour data extracted from Civitatis."""
+    """Structured tour data extracted from Civitatis.
+
+    Slotted: a scrape can hold thousands of these at once, and slots
+    drop the per-instance __dict__.
+    """
     civitatis_id: int
     name: str
     price: Decimal
@@ -79,8 +245,29 @@ class CivitatisScraper:
         self._browser: Browser | None = None
         self._context: BrowserContext | None = None
         self._playwright = None
-        self._last_request_time: float = 0
-        self._lock = asyncio.Lock()
+        self._sem = asyncio.Semaphore(settings.scrape_concurrency)
+        # Idle pages kept for reuse; a fresh CDP target costs
+        # 50-150ms plus a renderer heap per fetch. Fetches served per
+        # page are counted so long-lived pages get recycled before
+        # their renderer heap grows unbounded.
+        self._page_pool: asyncio.Queue[Page] = asyncio.Queue()
+        self._page_uses: dict[Page, int] = {}
+        # Context recycle bookkeeping: total fetches served, pages
+        # currently checked out, and when the context was created
+        self._pages_served = 0
+        self._pages_out = 0
+        self._context_started = 0.0
+        # Next monotonic instant at which a request may start
+        self._next_slot: float = 0.0
+        # Plain HTTP client for the browserless fast path
+        self._http: httpx.AsyncClient | None = None
+        # Success count per GTMData pattern, so the dominant one is
+        # tried first (each miss is a full-document DOTALL scan)
+        self._pattern_hits: list[int] = [0] * len(_RE_GTM_DATA)
+        # Recent destination results, plus in-flight fetches so
+        # concurrent callers for the same slug share one scrape
+        self._dest_cache: dict[tuple[str, str], tuple[float, list[TourData]]] = {}
+        self._dest_inflight: dict[tuple[str, str], asyncio.Task[list[TourData]]] = {}
 
     async def _ensure_browser(self) -> Browser:
         """Initialize browser if not already running."""
@@ -96,20 +283,101 @@ class CivitatisScraper:
                     "--disable-gpu",
                 ]
             )
-            self._context = await self._browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent=(
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/120.0.0.0 Safari/537.36"
-                ),
-                locale="en-US",
-            )
+            self._context = await self._new_context()
             logger.info("Browser initialized for Civitatis scraper")
         return self._browser
 
+    async def _new_context(self) -> BrowserContext:
+        """Create a browser context with the scraper's standard setup."""
+        context = await self._browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=(
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/120.0.0.0 Safari/537.36"
+            ),
+            locale="en-US",
+        )
+        await context.route("**/*", self._block_unneeded_resources)
+        await context.add_init_script(_EXTRACT_CARDS_INIT_JS)
+        self._context_started = time.monotonic()
+        return context
+
+    async def _recycle_context(self) -> None:
+        """Replace the browser context to bound long-run memory growth.
+
+        Only called when no pages are checked out, so in-flight
+        fetches never lose their context underneath them.
+        """
+        # Reset the triggers before the first await so a concurrent
+        # _get_page doesn't start a second recycle
+        self._pages_served = 0
+        self._context_started = time.monotonic()
+
+        while not self._page_pool.empty():
+            self._page_pool.get_nowait()
+        self._page_uses.clear()
+
+        old_context = self._context
+        self._context = await self._new_context()
+        if old_context:
+            await old_context.close()
+        logger.info("Browser context recycled")
+
+    @staticmethod
+    async def _block_unneeded_resources(route) -> None:
+        """Abort requests for resources the extraction never reads.
+
+        The scraper only needs the document HTML (GTMData lives in an
+        inline script) and the scripts that render tour cards; images,
+        fonts, media, stylesheets and analytics beacons are pure
+        bandwidth.
+        """
+        request = route.request
+        if request.resource_type in _BLOCKED_RESOURCE_TYPES or any(
+            host in request.url for host in _BLOCKED_HOSTS
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                headers={
+                    "User-Agent": (
+                        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                        "AppleWebKit/537.36 (KHTML, like Gecko) "
+                        "Chrome/120.0.0.0 Safari/537.36"
+                    ),
+                    "Accept-Language": "en-US,en;q=0.9",
+                },
+                follow_redirects=True,
+                timeout=15,
+            )
+        return self._http
+
+    async def _fetch_raw(self, url: str) -> str:
+        """Fetch raw page HTML over plain HTTP, without a browser."""
+        await self._rate_limit()
+        logger.info(f"Fetching raw: {url}")
+        response = await self._get_http().get(url)
+        response.raise_for_status()
+        return response.text
+
     async def close(self) -> None:
         """Close browser and cleanup resources."""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+        # Pooled pages die with their context; just drop the refs
+        while not self._page_pool.empty():
+            self._page_pool.get_nowait()
+        self._page_uses.clear()
+        self._dest_cache.clear()
+        self._pages_served = 0
+        self._pages_out = 0
         if self._context:
             await self._context.close()
             self._context = None
@@ -122,23 +390,142 @@ class CivitatisScraper:
         logger.info("Browser closed")
 
     async def _rate_limit(self) -> None:
-        """Enforce rate limiting between requests."""
-        async with self._lock:
-            now = asyncio.get_event_loop().time()
-            elapsed = now - self._last_request_time
-            delay = settings.scrape_rate_limit_seconds
+        """Enforce rate limiting between requests.
 
-            if elapsed < delay and self._last_request_time > 0:
-                wait_time = delay - elapsed
-                logger.info(f"Rate limiting: waiting {wait_time:.1f}s")
-                await asyncio.sleep(wait_time)
+        Lockless slot reservation: each caller claims the next start
+        slot in one read-modify-write (safe because the event loop
+        never preempts between the read and the write), then sleeps
+        until its slot. Concurrent fetchers space out their starts
+        without serializing behind a lock.
+        """
+        delay = settings.scrape_rate_limit_seconds
+        if delay <= 0:
+            return
 
-            self._last_request_time = asyncio.get_event_loop().time()
+        now = time.monotonic()
+        wait_time = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + delay
+
+        if wait_time > 0:
+            logger.info(f"Rate limiting: waiting {wait_time:.1f}s")
+            await asyncio.sleep(wait_time)
 
     async def _get_page(self) -> Page:
-        """Get a new browser page."""
+        """Get a pooled browser page, creating one if none are idle."""
         await self._ensure_browser()
-        return await self._context.new_page()
+        if self._pages_out == 0 and (
+            self._pages_served >= _CONTEXT_RECYCLE_PAGES
+            or time.monotonic() - self._context_started >= _CONTEXT_RECYCLE_SECONDS
+        ):
+            await self._recycle_context()
+        self._pages_out += 1
+        try:
+            return self._page_pool.get_nowait()
+        except asyncio.QueueEmpty:
+            return await self._context.new_page()
+
+    async def _release_page(self, page: Page) -> None:
+        """Return a page to the pool, or close it if the pool is full.
+
+        Navigating to about:blank releases the old document while
+        keeping the CDP target alive for the next fetch. Callers must
+        detach any page.on listeners they registered before releasing.
+        """
+        self._pages_out = max(0, self._pages_out - 1)
+        self._pages_served += 1
+
+        uses = self._page_uses.get(page, 0) + 1
+        if uses >= _PAGE_RECYCLE_USES:
+            # Renderer heaps grow across navigations; retire the page
+            # after enough fetches rather than reusing it forever
+            self._page_uses.pop(page, None)
+            await page.close()
+            return
+
+        try:
+            await page.goto("about:blank")
+        except Exception:
+            self._page_uses.pop(page, None)
+            await page.close()
+            return
+        if self._page_pool.qsize() < settings.scrape_concurrency:
+            self._page_uses[page] = uses
+            self._page_pool.put_nowait(page)
+        else:
+            self._page_uses.pop(page, None)
+            await page.close()
+
+    async def _wait_for_settled_dom(self, page: Page, timeout: float = 10.0) -> None:
+        """
+        Wait until the page's network activity settles.
+
+        Tracks inflight requests over a CDP session and returns once
+        none have been active for a quiet window. Replaces
+        wait_until="networkidle" plus a fixed 2s sleep: most pages
+        settle well under a second, and long-polling requests that
+        never finish (dropped after a stall threshold) no longer hold
+        the fetch hostage. Always returns after `timeout` seconds.
+        """
+        cdp = await page.context.new_cdp_session(page)
+        loop = asyncio.get_event_loop()
+        inflight: dict[str, float] = {}
+
+        def on_request(event: dict) -> None:
+            # Long-lived streams never "finish" and would defeat the
+            # quiet window
+            if event.get("type") in ("WebSocket", "EventSource"):
+                return
+            inflight[event["requestId"]] = loop.time()
+
+        def on_done(event: dict) -> None:
+            inflight.pop(event.get("requestId"), None)
+
+        cdp.on("Network.requestWillBeSent", on_request)
+        cdp.on("Network.loadingFinished", on_done)
+        cdp.on("Network.loadingFailed", on_done)
+        await cdp.send("Network.enable")
+
+        try:
+            deadline = loop.time() + timeout
+            quiet_since: float | None = None
+
+            while True:
+                now = loop.time()
+                if now >= deadline:
+                    logger.debug("Settled-DOM wait timed out, proceeding")
+                    return
+
+                # Drop stalled requests so one hung resource cannot
+                # block the whole fetch
+                for request_id, started_at in list(inflight.items()):
+                    if now - started_at > _SETTLE_STALL_SECONDS:
+                        inflight.pop(request_id, None)
+
+                if inflight:
+                    quiet_since = None
+                elif quiet_since is None:
+                    quiet_since = now
+                elif now - quiet_since >= _SETTLE_QUIET_SECONDS:
+                    return
+
+                await asyncio.sleep(_SETTLE_POLL_SECONDS)
+        finally:
+            try:
+                await cdp.detach()
+            except Exception:
+                pass  # Page may already be closing
+
+    async def _dismiss_cookie_banner(self, page: Page) -> None:
+        """Accept the cookie banner if one is showing.
+
+        The lookup and click happen in one in-page evaluate; the brief
+        settle wait is only paid when a button was actually clicked.
+        """
+        try:
+            if await page.evaluate(_DISMISS_COOKIES_JS):
+                await page.wait_for_timeout(200)
+        except Exception:
+            pass  # Banner not found or page already navigating
 
     @retry(
         stop=stop_after_attempt(3),
@@ -152,177 +539,184 @@ class CivitatisScraper:
         page = await self._get_page()
         try:
             logger.info(f"Fetching: {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-
-            # Wait for content to be fully loaded
-            await page.wait_for_timeout(2000)
-
-            # Try to close cookie banner if present
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
             try:
-                cookie_selectors = [
-                    "button:has-text('Accept')",
-                    "button:has-text('Aceptar')",
-                    "[class*='cookie'] button",
-                    "#onetrust-accept-btn-handler",
-                ]
-                for selector in cookie_selectors:
-                    btn = page.locator(selector)
-                    if await btn.count() > 0:
-                        await btn.first.click()
-                        await page.wait_for_timeout(500)
-                        break
+                # The page is usable as soon as GTMData exists, which
+                # typically beats waiting for the network to settle
+                await page.wait_for_function(
+                    "window.GTMData && window.GTMData.ecommerce", timeout=15000
+                )
             except Exception:
-                pass  # Cookie banner not found or already closed
+                await self._wait_for_settled_dom(page)
+
+            await self._dismiss_cookie_banner(page)
 
             html = await page.content()
             logger.info(f"Fetched {len(html):,} bytes from {url}")
             return html
         finally:
-            await page.close()
+            await self._release_page(page)
 
-    async def _fetch_page_with_prices(self, url: str) -> tuple[str, dict[str, Decimal]]:
+    async def _fetch_page_with_prices(
+        self, url: str
+    ) -> tuple[dict[str, Any] | None, dict[str, int]]:
         """
-        Fetch page content and extract displayed prices from HTML.
+        Fetch a listing page, returning GTMData and displayed prices.
+
+        GTMData is read as a parsed object straight from the page's JS
+        context; the captured document body and regex extraction serve
+        only as fallbacks.
 
         Returns:
-            Tuple of (html_content, {tour_url: displayed_price})
+            Tuple of (gtm_data, {tour_url: displayed_price_cents})
         """
         await self._rate_limit()
 
         page = await self._get_page()
-        prices_by_url: dict[str, Decimal] = {}
+        prices_by_url: dict[str, int] = {}
 
-        try:
-            logger.info(f"Fetching with price extraction: {url}")
-            await page.goto(url, wait_until="networkidle", timeout=30000)
-            await page.wait_for_timeout(2000)
+        # GTMData lives in an inline script in the raw document, so the
+        # network response body already has everything _extract_gtm_data
+        # needs — capture it as it arrives instead of serializing the
+        # whole rendered DOM back over CDP afterwards
+        document_body: asyncio.Future[str] = asyncio.get_event_loop().create_future()
 
-            # Try to close cookie banner if present
-            try:
-                cookie_selectors = [
-                    "button:has-text('Accept')",
-                    "button:has-text('Aceptar')",
-                    "[class*='cookie'] button",
-                    "#onetrust-accept-btn-handler",
-                ]
-                for selector in cookie_selectors:
-                    btn = page.locator(selector)
-                    if await btn.count() > 0:
-                        await btn.first.click()
-                        await page.wait_for_timeout(500)
-                        break
-            except Exception:
-                pass
+        async def capture_document(response) -> None:
+            if response.request.resource_type == "document" and response.ok:
+                if not document_body.done():
+                    try:
+                        document_body.set_result(await response.text())
+                    except Exception as e:
+                        if not document_body.done():
+                            document_body.set_exception(e)
 
-            # Extract prices from tour cards
-            # Civitatis tour cards have links with href and price elements
-            tour_cards = page.locator("article.comfort-card, .o-search-list__item, [data-gtm-click]")
-            card_count = await tour_cards.count()
-            logger.info(f"Found {card_count} tour cards")
+        page.on("response", capture_document)
 
-            for i in range(card_count):
-                try:
-                    card = tour_cards.nth(i)
+        try:
+            logger.info(f"Fetching with price extraction: {url}")
+            await page.goto(url, wait_until="commit", timeout=30000)
+            await self._wait_for_settled_dom(page)
 
-                    # Get tour URL from the card's link
-                    link = card.locator("a[href*='/en/'], a[href*='/it/'], a[href*='/es/']").first
-                    href = await link.get_attribute("href") if await link.count() > 0 else None
+            await self._dismiss_cookie_banner(page)
 
-                    if not href:
-                        # Try alternative selectors
-                        link = card.locator("a").first
-                        href = await link.get_attribute("href") if await link.count() > 0 else None
+            # Extract every card's link and price text in one in-page
+            # pass; each locator call is a separate CDP round-trip, so
+            # probing N cards individually cost hundreds of them
+            cards = await page.evaluate("window.__civitatisExtract()")
+            logger.info(f"Found {len(cards)} tour cards")
 
+            for i, card in enumerate(cards):
+                try:
+                    href = card["href"]
                     if not href:
                         continue
 
-                    # Extract displayed price from the card
-                    # Look for price with currency symbol to avoid catching ratings
-                    card_text = await card.text_content() or ""
-
                     # First try to find price with "From" pattern (most reliable)
-                    # Patterns: "From €59", "A partire da €59", "Desde 59 €"
-                    price_value = None
-                    price_patterns = [
-                        r'(?:From|A partire da|Desde)\s*[€$£]\s*(\d+(?:[.,]\d{2})?)',
-                        r'(?:From|A partire da|Desde)\s*(\d+(?:[.,]\d{2})?)\s*[€$£]',
-                        r'[€$£]\s*(\d+(?:[.,]\d{2})?)\s*(?:per person|a persona)?',
-                    ]
-
-                    for pattern in price_patterns:
-                        price_match = re.search(pattern, card_text, re.IGNORECASE)
+                    price_cents = None
+                    for pattern in _RE_CARD_PRICES:
+                        price_match = pattern.search(card["cardText"])
                         if price_match:
-                            price_str = price_match.group(1).replace(',', '.')
-                            try:
-                                price_value = Decimal(price_str)
-                                # Sanity check: prices should typically be > 1 and < 10000
-                                if price_value > 1 and price_value < 10000:
-                                    logger.debug(f"Extracted price {price_value} for {href} via pattern")
-                                    break
-                                else:
-                                    price_value = None
-                            except Exception:
-                                price_value = None
-
-                    # If still no price, try specific selectors but verify with currency
-                    if not price_value:
-                        price_selectors = [
-                            ".comfort-card__price__current",
-                            ".m-activity-card__price",
-                            ".a-activity-card__price-current",
-                        ]
-                        for selector in price_selectors:
-                            try:
-                                price_elem = card.locator(selector).first
-                                if await price_elem.count() > 0:
-                                    elem_text = await price_elem.text_content()
-                                    # Only accept if it contains a currency symbol
-                                    if elem_text and ('€' in elem_text or '$' in elem_text or '£' in elem_text):
-                                        price_clean = re.sub(r'[^\d.,]', '', elem_text)
-                                        price_clean = price_clean.replace(',', '.')
-                                        if price_clean:
-                                            price_value = Decimal(price_clean)
-                                            if price_value > 1 and price_value < 10000:
-                                                logger.debug(f"Extracted price {price_value} for {href} via selector")
-                                                break
-                                            else:
-                                                price_value = None
-                            except Exception:
-                                continue
-
-                    if price_value:
-                        prices_by_url[href] = price_value
+                            cents = _parse_price_cents(price_match.group(1))
+                            # Sanity check: prices should typically be > 1 and < 10000
+                            if cents is not None and 100 < cents < 1_000_000:
+                                price_cents = cents
+                                logger.debug(f"Extracted price {cents / 100} for {href} via pattern")
+                                break
+
+                    # If still no price, use the price element's text but
+                    # verify with currency to avoid catching ratings
+                    if not price_cents:
+                        elem_text = card["priceText"]
+                        if elem_text and ('€' in elem_text or '$' in elem_text or '£' in elem_text):
+                            cents = _parse_price_cents(elem_text)
+                            if cents is not None and 100 < cents < 1_000_000:
+                                price_cents = cents
+                                logger.debug(f"Extracted price {cents / 100} for {href} via selector")
+
+                    if price_cents:
+                        prices_by_url[href] = price_cents
 
                 except Exception as e:
                     logger.debug(f"Error extracting price from card {i}: {e}")
                     continue
 
             logger.info(f"Extracted {len(prices_by_url)} prices from HTML")
-            html = await page.content()
-            return html, prices_by_url
+
+            # The page already parsed GTMData; ship the object itself
+            # over CDP instead of HTML to regex through
+            gtm_data = await page.evaluate("() => window.GTMData || null")
+            if not isinstance(gtm_data, dict) or not gtm_data:
+                try:
+                    html = await asyncio.wait_for(
+                        asyncio.shield(document_body), timeout=2.0
+                    )
+                except Exception:
+                    # Response body unavailable (redirect chain,
+                    # eviction): GTMData lives in a <script>, so pull
+                    # just the script text, not the whole DOM
+                    html = await page.evaluate(
+                        "() => Array.from(document.scripts)"
+                        ".map((s) => s.textContent).join('\\n;\\n')"
+                    )
+                gtm_data = self._extract_gtm_data(html)
+            return gtm_data, prices_by_url
 
         finally:
-            await page.close()
+            page.remove_listener("response", capture_document)
+            await self._release_page(page)
 
     def _extract_gtm_data(self, html: str) -> dict[str, Any] | None:
-        """Extract GTMData JSON from page HTML."""
-        # Look for GTMData variable assignment
-        patterns = [
-            r'var\s+GTMData\s*=\s*({.*?});',
-            r'GTMData\s*=\s*({.*?});',
-            r'dataLayer\.push\(({.*?"ecommerce".*?})\)',
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, html, re.DOTALL)
+        """Extract GTMData JSON from page HTML.
+
+        Locates an anchor with str.find (a C-level scan) and parses
+        exactly one balanced object with raw_decode, instead of
+        backtracking a DOTALL regex across the whole document. The
+        most successful anchor is tried first.
+        """
+        order = sorted(
+            range(len(_GTM_ANCHORS)),
+            key=self._pattern_hits.__getitem__,
+            reverse=True,
+        )
+        for idx in order:
+            anchor = _GTM_ANCHORS[idx]
+            pos = html.find(anchor)
+            while pos != -1:
+                brace = html.find("{", pos + len(anchor))
+                if brace == -1:
+                    break
+                try:
+                    data, _ = _JSON_DECODER.raw_decode(html, brace)
+                except ValueError:
+                    # Trailing commas break strict parsing; repair a
+                    # "};"-bounded slice of the candidate rather than
+                    # re-scanning the whole document with regex
+                    data = None
+                    end = html.find("};", brace)
+                    if end != -1:
+                        try:
+                            data = orjson.loads(
+                                _RE_TRAILING_COMMA.sub(r"\1", html[brace : end + 1])
+                            )
+                        except orjson.JSONDecodeError:
+                            data = None
+                # dataLayer.push carries many payloads; only the
+                # ecommerce one is GTMData
+                if isinstance(data, dict) and data and (
+                    anchor != "dataLayer.push(" or "ecommerce" in data
+                ):
+                    self._pattern_hits[idx] += 1
+                    return data
+                pos = html.find(anchor, pos + len(anchor))
+
+        # Last resort: legacy DOTALL patterns over the full document,
+        # with the same trailing-comma cleanup
+        for pattern in _RE_GTM_DATA:
+            match = pattern.search(html)
             if match:
                 try:
-                    json_str = match.group(1)
-                    # Clean up potential issues
-                    json_str = re.sub(r',\s*}', '}', json_str)
-                    json_str = re.sub(r',\s*]', ']', json_str)
-                    return json.loads(json_str)
-                except json.JSONDecodeError as e:
+                    return orjson.loads(_RE_TRAILING_COMMA.sub(r'\1', match.group(1)))
+                except orjson.JSONDecodeError as e:
                     logger.warning(f"Failed to parse GTMData: {e}")
                     continue
 
@@ -333,7 +727,7 @@ class CivitatisScraper:
         gtm_data: dict[str, Any],
         destination: str | None = None,
         destination_id: int | None = None,
-        html_prices: dict[str, Decimal] | None = None,
+        html_prices: dict[str, int] | None = None,
     ) -> list[TourData]:
         """
         Parse tour impressions from GTMData, using HTML prices when available.
@@ -342,7 +736,7 @@ class CivitatisScraper:
             gtm_data: GTMData dictionary from page
             destination: Destination name override
             destination_id: Destination ID override
-            html_prices: Dictionary mapping tour URLs to displayed prices
+            html_prices: Dictionary mapping tour URLs to displayed prices in cents
 
         Returns:
             List of TourData objects with accurate prices
@@ -354,6 +748,14 @@ class CivitatisScraper:
         impressions = ecommerce.get("impressions", [])
         currency = ecommerce.get("currencyCode", "EUR")
 
+        # Index HTML prices by URL slug once, so each impression is a
+        # dict lookup instead of a rescan of every price entry
+        slug_prices = {
+            url_key.rstrip('/').rsplit('/', 1)[-1]: html_price
+            for url_key, html_price in html_prices.items()
+        }
+        lowered_slugs = [(slug.lower(), p) for slug, p in slug_prices.items()]
+
         for imp in impressions:
             try:
                 tour_id = imp.get("id")
@@ -368,33 +770,31 @@ class CivitatisScraper:
                 # Prefer HTML-displayed price over GTMData price
                 # Note: GTMData prices are often incorrect (internal/analytics prices)
                 price = None
+                price_cents = None
 
-                if html_prices:
-                    # Try to match by URL or tour name
-                    tour_url_slug = tour_url.rstrip('/').split('/')[-1] if tour_url else None
-
-                    for url_key, html_price in html_prices.items():
-                        url_key_slug = url_key.rstrip('/').split('/')[-1]
-
-                        # Match by URL slug (last part of URL path)
-                        if tour_url_slug and tour_url_slug == url_key_slug:
-                            price = html_price
-                            logger.debug(f"Using HTML price {price} for {name} (URL match)")
-                            break
+                if slug_prices:
+                    # Match by URL slug (last part of URL path)
+                    if tour_url:
+                        price_cents = slug_prices.get(tour_url.rstrip('/').rsplit('/', 1)[-1])
+                        if price_cents is not None:
+                            logger.debug(f"Using HTML price {price_cents / 100} for {name} (URL match)")
 
+                    if price_cents is None:
                         # Match by tour name similarity (normalize both)
                         name_normalized = name.lower().replace(' ', '-').replace('&', '').replace("'", '')
-                        url_normalized = url_key_slug.lower()
-                        if name_normalized in url_normalized or url_normalized in name_normalized:
-                            price = html_price
-                            logger.debug(f"Using HTML price {price} for {name} (name match)")
-                            break
-
-                # Fall back to GTMData price if no HTML price found
-                if price is None:
-                    if gtm_price and gtm_price > 0:
-                        price = Decimal(str(gtm_price))
-                        logger.debug(f"Using GTMData price {price} for {name} (no HTML price)")
+                        for url_normalized, html_cents in lowered_slugs:
+                            if name_normalized in url_normalized or url_normalized in name_normalized:
+                                price_cents = html_cents
+                                logger.debug(f"Using HTML price {price_cents / 100} for {name} (name match)")
+                                break
+
+                if price_cents is not None:
+                    # Decimal enters only here, once per matched tour
+                    price = Decimal(price_cents).scaleb(-2)
+                elif gtm_price and gtm_price > 0:
+                    # Fall back to GTMData price if no HTML price found
+                    price = Decimal(str(gtm_price))
+                    logger.debug(f"Using GTMData price {price} for {name} (no HTML price)")
 
                 if not name or not price or price <= 0:
                     continue
@@ -428,8 +828,10 @@ class CivitatisScraper:
         """
         Get all tours for a specific destination.
 
-        Uses HTML price extraction for accurate "From €XX" prices,
-        with GTMData as fallback for metadata and backup pricing.
+        Results are cached in-process for a short TTL, and concurrent
+        callers for the same destination coalesce onto one scrape —
+        so an overlapping manual sync and scheduled sync hit Civitatis
+        once per destination, not twice.
 
         Args:
             destination_slug: URL slug (e.g., "rome", "paris", "barcelona")
@@ -438,12 +840,45 @@ class CivitatisScraper:
         Returns:
             List of TourData objects with accurate displayed prices
         """
+        key = (destination_slug, language)
+
+        cached = self._dest_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < _DEST_CACHE_TTL_SECONDS:
+            logger.info(f"Serving {destination_slug} from scrape cache")
+            return list(cached[1])
+
+        task = self._dest_inflight.get(key)
+        if task is not None:
+            # Another caller is already scraping this destination;
+            # awaiting its task does not cancel it if we are cancelled
+            return list(await task)
+
+        task = asyncio.ensure_future(
+            self._scrape_destination_tours(destination_slug, language)
+        )
+        self._dest_inflight[key] = task
+        try:
+            tours = await task
+        finally:
+            self._dest_inflight.pop(key, None)
+        self._dest_cache[key] = (time.monotonic(), tours)
+        return list(tours)
+
+    async def _scrape_destination_tours(
+        self,
+        destination_slug: str,
+        language: str,
+    ) -> list[TourData]:
+        """Scrape one destination page, bypassing the cache.
+
+        Uses HTML price extraction for accurate "From €XX" prices,
+        with GTMData as fallback for metadata and backup pricing.
+        """
         url = f"{self.BASE_URL}/{language}/{destination_slug}/"
 
         # Fetch page and extract HTML prices simultaneously
-        html, html_prices = await self._fetch_page_with_prices(url)
+        gtm_data, html_prices = await self._fetch_page_with_prices(url)
 
-        gtm_data = self._extract_gtm_data(html)
         if not gtm_data:
             logger.warning(f"No GTMData found for {destination_slug}")
             return []
@@ -460,6 +895,91 @@ class CivitatisScraper:
         logger.info(f"Found {len(tours)} tours for {destination_slug} ({html_priced} with HTML prices)")
         return tours
 
+    async def get_destination_tours_fast(
+        self,
+        destination_slug: str,
+        language: str = "en",
+    ) -> list[TourData]:
+        """
+        Get tours for a destination without launching a browser.
+
+        Civitatis destination pages usually server-render the GTMData
+        script, so a plain HTTP fetch plus _extract_gtm_data covers the
+        happy path at a fraction of the browser's cost. Prices come
+        from GTMData only (there is no rendered DOM to read displayed
+        prices from), so this trades some price accuracy for skipping
+        the whole browser lifecycle. Falls back to the full Playwright
+        path whenever GTMData is missing or empty.
+
+        Args:
+            destination_slug: URL slug (e.g., "rome", "paris")
+            language: Language code (default: "en")
+
+        Returns:
+            List of TourData objects
+        """
+        url = f"{self.BASE_URL}/{language}/{destination_slug}/"
+
+        html: str | None = None
+        try:
+            html = await self._fetch_raw(url)
+        except httpx.HTTPError as e:
+            logger.warning(f"Raw fetch failed for {destination_slug}: {e}")
+
+        if html:
+            gtm_data = self._extract_gtm_data(html)
+            if gtm_data and gtm_data.get("ecommerce", {}).get("impressions"):
+                tours = self._parse_impressions(
+                    gtm_data,
+                    destination=destination_slug.title(),
+                )
+                if tours:
+                    logger.info(
+                        f"Found {len(tours)} tours for {destination_slug} (fast path)"
+                    )
+                    return tours
+
+        logger.info(f"Fast path missed for {destination_slug}, using browser")
+        return await self.get_destination_tours(destination_slug, language=language)
+
+    async def get_many_destinations(
+        self,
+        destination_slugs: list[str],
+        language: str = "en",
+    ) -> dict[str, list[TourData]]:
+        """
+        Fetch several destinations concurrently.
+
+        Each fetch still passes through the rate limiter, but page
+        loads and parsing overlap up to scrape_concurrency pages
+        instead of running strictly one after another.
+
+        Args:
+            destination_slugs: URL slugs to fetch
+            language: Language code (default: "en")
+
+        Returns:
+            Dict mapping each slug to its tours; failed fetches map
+            to an empty list
+        """
+        async def fetch_one(slug: str) -> list[TourData]:
+            async with self._sem:
+                return await self.get_destination_tours(slug, language=language)
+
+        results = await asyncio.gather(
+            *(fetch_one(slug) for slug in destination_slugs),
+            return_exceptions=True,
+        )
+
+        tours_by_slug: dict[str, list[TourData]] = {}
+        for slug, result in zip(destination_slugs, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching destination {slug}: {result}")
+                tours_by_slug[slug] = []
+            else:
+                tours_by_slug[slug] = result
+        return tours_by_slug
+
     async def search_tours(
         self,
         query: str,
@@ -481,9 +1001,8 @@ class CivitatisScraper:
         url = f"{self.BASE_URL}/{language}/search/?q={quote_plus(query)}"
 
         # Fetch page and extract HTML prices
-        html, html_prices = await self._fetch_page_with_prices(url)
+        gtm_data, html_prices = await self._fetch_page_with_prices(url)
 
-        gtm_data = self._extract_gtm_data(html)
         if not gtm_data:
             logger.warning(f"No GTMData found for search: {query}")
             return []
@@ -512,66 +1031,54 @@ class CivitatisScraper:
         page = await self._get_page()
 
         try:
-            await page.goto(tour_url, wait_until="networkidle", timeout=30000)
-            await page.wait_for_timeout(2000)
-
-            # Close cookie banner if present
-            try:
-                for selector in ["button:has-text('Accept')", "#onetrust-accept-btn-handler"]:
-                    btn = page.locator(selector)
-                    if await btn.count() > 0:
-                        await btn.first.click()
-                        await page.wait_for_timeout(500)
-                        break
-            except Exception:
-                pass
+            await page.goto(tour_url, wait_until="commit", timeout=30000)
+            await self._wait_for_settled_dom(page)
+
+            await self._dismiss_cookie_banner(page)
+
+            # One in-page pass reads GTMData's detail product and the
+            # displayed price element, replacing a page.content() dump
+            # plus regex scans (where the first "name":"..." in the
+            # HTML is not necessarily the tour's)
+            details: dict[str, Any] = await page.evaluate(_EXTRACT_DETAIL_JS) or {}
+            tour_id = details.get("id")
+            name = details.get("name")
+            html: str | None = None
+
+            if tour_id is None or not name:
+                # GTMData wasn't populated in-page; scan the HTML once
+                # with the legacy patterns
+                html = await page.content()
+                name_match = _RE_TOUR_NAME.search(html)
+                id_match = _RE_TOUR_ID.search(html)
+                if not (name_match and id_match):
+                    logger.warning(f"Could not extract tour details from {tour_url}")
+                    return None
+                name = name or name_match.group(1)
+                if tour_id is None:
+                    tour_id = id_match.group(1)
 
-            html = await page.content()
-
-            # Extract metadata from GTMData/JSON for ID and name
-            name_match = re.search(r'"name":\s*"([^"]+)"', html)
-            id_match = re.search(r'"id":\s*(\d+)', html)
-
-            if not all([name_match, id_match]):
-                logger.warning(f"Could not extract tour details from {tour_url}")
-                return None
-
-            # Extract displayed price from HTML
-            # Try multiple selectors for the main price display
             price = None
-            price_selectors = [
-                ".m-activity-info__price-container .price",
-                ".o-activity-price__amount",
-                "[class*='price'] [class*='amount']",
-                ".m-activity-card__price",
-                "span[class*='Price']",
-            ]
-
-            for selector in price_selectors:
-                try:
-                    price_elem = page.locator(selector).first
-                    if await price_elem.count() > 0:
-                        price_text = await price_elem.text_content()
-                        if price_text:
-                            price_clean = re.sub(r'[^\d.,]', '', price_text)
-                            price_clean = price_clean.replace(',', '.')
-                            if price_clean:
-                                price = Decimal(price_clean)
-                                break
-                except Exception:
-                    continue
-
-            # Fallback: search for price pattern in visible text
-            if not price:
-                body_text = await page.locator("body").text_content()
-                price_match = re.search(r'(?:From|A partire da)\s*[€$£]\s*(\d+(?:[.,]\d{2})?)', body_text or "")
+            price_text = details.get("priceText")
+            if price_text:
+                cents = _parse_price_cents(price_text)
+                if cents:
+                    price = Decimal(cents).scaleb(-2)
+
+            # Fallback: "From €XX" pattern in the visible text
+            if not price and details.get("bodyText"):
+                price_match = _RE_FROM_PRICE.search(details["bodyText"])
                 if price_match:
-                    price_str = price_match.group(1).replace(',', '.')
-                    price = Decimal(price_str)
+                    cents = _parse_price_cents(price_match.group(1))
+                    if cents:
+                        price = Decimal(cents).scaleb(-2)
 
             # Final fallback to GTMData price (though less accurate)
-            if not price:
-                gtm_price_match = re.search(r'"price":\s*([\d.]+)', html)
+            if not price and details.get("gtmPrice"):
+                price = Decimal(str(details["gtmPrice"]))
+                logger.warning(f"Using GTMData price as fallback for {tour_url}")
+            elif not price and html:
+                gtm_price_match = _RE_GTM_PRICE.search(html)
                 if gtm_price_match:
                     price = Decimal(gtm_price_match.group(1))
                     logger.warning(f"Using GTMData price as fallback for {tour_url}")
@@ -581,15 +1088,38 @@ class CivitatisScraper:
                 return None
 
             return TourData(
-                civitatis_id=int(id_match.group(1)),
-                name=name_match.group(1),
+                civitatis_id=int(tour_id),
+                name=name.replace("39s", "'s"),  # Same encoding fix as impressions
                 price=price,
                 url=tour_url,
             )
 
         finally:
-            await page.close()
+            await self._release_page(page)
+
+
+# Global scraper instance, created lazily so workers that never scrape
+# skip the instance and its event-loop-bound primitives entirely
+_instance: CivitatisScraper | None = None
+
+
+def get_civitatis_scraper() -> CivitatisScraper:
+    """Return the shared scraper, creating it on first use."""
+    global _instance
+    if _instance is None:
+        _instance = CivitatisScraper()
+    return _instance
+
+
+async def close_civitatis_scraper() -> None:
+    """Close the shared scraper if it was ever created."""
+    if _instance is not None:
+        await _instance.close()
 
 
-# Global scraper instance
-civitatis_scraper = CivitatisScraper()
+def __getattr__(name: str):
+    # Keep the historical module attribute without instantiating at
+    # import time (same PEP 562 pattern as the services package)
+    if name == "civitatis_scraper":
+        return get_civitatis_scraper()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -3,21 +3,27 @@
 Handles syncing tour prices from Civitatis and updating the database.
 """
 
+import asyncio
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import func, select, update
+from sqlalchemy import Integer, Numeric, column, func, insert, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import get_settings
-from src.core.database import AsyncSessionLocal
+from src.core.database import BackgroundSessionLocal
 from src.models import PriceHistory, Tour
-from src.services.civitatis_scraper import TourData, civitatis_scraper
+from src.services.civitatis_scraper import TourData, get_civitatis_scraper
 from src.utils.logger import get_logger
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Decimal literals used per price change, built once
+_D0 = Decimal(0)
+_D100 = Decimal(100)
+
 
 class PriceSyncService:
     """Service for synchronizing tour prices from Civitatis."""
@@ -36,6 +42,9 @@ class PriceSyncService:
         "amsterdam",
     ]
 
+    # Max rows per bulk INSERT to bound statement size and memory
+    INSERT_BATCH_SIZE = 500
+
     def __init__(self):
         self._destinations = self.DEFAULT_DESTINATIONS.copy()
 
@@ -47,10 +56,18 @@ class PriceSyncService:
         self,
         destination: str,
         db: AsyncSession,
+        only_cids: set[int] | None = None,
     ) -> dict:
         """
         Sync all tours for a specific destination.
 
+        Args:
+            destination: Destination slug to scrape
+            db: Session the sync writes through
+            only_cids: When given, restrict the upsert to these
+                civitatis_ids (used by sync_active_tours, which only
+                refreshes tours already tracked)
+
         Returns:
             Dict with sync statistics
         """
@@ -65,22 +82,14 @@ class PriceSyncService:
 
         try:
             logger.info(f"Syncing destination: {destination}")
-            tours = await civitatis_scraper.get_destination_tours(destination)
+            tours = await get_civitatis_scraper().get_destination_tours(destination)
             stats["tours_found"] = len(tours)
 
-            for tour_data in tours:
-                try:
-                    result = await self._sync_tour(tour_data, db)
-                    if result == "created":
-                        stats["tours_created"] += 1
-                    elif result == "updated":
-                        stats["tours_updated"] += 1
-                    elif result == "price_changed":
-                        stats["tours_updated"] += 1
-                        stats["price_changes"] += 1
-                except Exception as e:
-                    logger.error(f"Error syncing tour {tour_data.civitatis_id}: {e}")
-                    stats["errors"] += 1
+            if only_cids is not None:
+                tours = [t for t in tours if t.civitatis_id in only_cids]
+
+            if tours:
+                await self._sync_tours_bulk(tours, db, stats)
 
             await db.commit()
             logger.info(
@@ -98,128 +107,182 @@ class PriceSyncService:
 
         return stats
 
-    async def _sync_tour(
+    async def _sync_tours_bulk(
         self,
-        tour_data: TourData,
+        tours: list[TourData],
         db: AsyncSession,
-    ) -> str:
+        stats: dict,
+    ) -> None:
         """
-        Sync a single tour to the database.
+        Upsert a destination's scraped tours in one statement.
 
-        Returns:
-            'created', 'updated', or 'price_changed'
+        One SELECT fetches the previous prices, one
+        INSERT ... ON CONFLICT DO UPDATE writes every tour, and price
+        history rows are bulk-inserted afterwards — instead of a
+        SELECT plus flush round-trip per tour.
         """
-        # Check if tour exists
+        # Deduplicate: the same tour can appear twice on a listing page
+        by_cid: dict[int, TourData] = {t.civitatis_id: t for t in tours}
+
         result = await db.execute(
-            select(Tour).where(Tour.civitatis_id == tour_data.civitatis_id)
-        )
-        existing_tour = result.scalar_one_or_none()
-
-        if existing_tour is None:
-            # Create new tour
-            tour = Tour(
-                civitatis_id=tour_data.civitatis_id,
-                name=tour_data.name,
-                current_price=tour_data.price,
-                currency=tour_data.currency,
-                url=tour_data.url,
-                destination=tour_data.destination,
-                destination_id=tour_data.destination_id,
-                category=tour_data.category,
-                rating=tour_data.rating,
-                min_price=tour_data.price,
-                max_price=tour_data.price,
-                avg_price=tour_data.price,
+            select(Tour.civitatis_id, Tour.current_price).where(
+                Tour.civitatis_id.in_(by_cid)
             )
-            db.add(tour)
-            await db.flush()
-
-            # Add initial price history
-            price_record = PriceHistory(
-                tour_id=tour.id,
-                price=tour_data.price,
-                currency=tour_data.currency,
-            )
-            db.add(price_record)
-
-            return "created"
-
-        # Update existing tour
-        old_price = existing_tour.current_price
-        price_changed = old_price != tour_data.price
-
-        existing_tour.name = tour_data.name
-        existing_tour.current_price = tour_data.price
-        existing_tour.url = tour_data.url or existing_tour.url
-        existing_tour.category = tour_data.category or existing_tour.category
-        existing_tour.rating = tour_data.rating or existing_tour.rating
-        existing_tour.last_scraped_at = datetime.now(timezone.utc)
-        existing_tour.is_active = True
-
-        if price_changed:
-            # Calculate price change
+        )
+        old_prices = {row.civitatis_id: row.current_price for row in result.all()}
+
+        insert_rows = [
+            {
+                "civitatis_id": tour_data.civitatis_id,
+                "name": tour_data.name,
+                "current_price": tour_data.price,
+                "currency": tour_data.currency,
+                "url": tour_data.url,
+                "destination": tour_data.destination,
+                "destination_id": tour_data.destination_id,
+                "category": tour_data.category,
+                "rating": tour_data.rating,
+                "min_price": tour_data.price,
+                "max_price": tour_data.price,
+                "avg_price": tour_data.price,
+            }
+            for tour_data in by_cid.values()
+        ]
+
+        stmt = pg_insert(Tour).values(insert_rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["civitatis_id"],
+            # Mirrors the old per-tour update: scraped fields win,
+            # except url/category/rating which keep the stored value
+            # when the scrape came back empty
+            set_={
+                "name": stmt.excluded.name,
+                "current_price": stmt.excluded.current_price,
+                "url": func.coalesce(stmt.excluded.url, Tour.url),
+                "category": func.coalesce(stmt.excluded.category, Tour.category),
+                "rating": func.coalesce(stmt.excluded.rating, Tour.rating),
+                "last_scraped_at": func.now(),
+                "is_active": True,
+            },
+        ).returning(Tour.id, Tour.civitatis_id)
+        result = await db.execute(stmt)
+        id_by_cid = {row.civitatis_id: row.id for row in result.all()}
+
+        # Price history rows are accumulated and bulk-inserted once per
+        # destination instead of one INSERT round-trip per tour
+        price_rows: list[dict] = []
+        changed: list[tuple[int, Decimal, TourData, Decimal, Decimal]] = []
+
+        for cid, tour_data in by_cid.items():
+            tour_id = id_by_cid.get(cid)
+            if tour_id is None:
+                continue
+
+            old_price = old_prices.get(cid)
+            if old_price is None:
+                stats["tours_created"] += 1
+                price_rows.append(
+                    {
+                        "tour_id": tour_id,
+                        "price": tour_data.price,
+                        "currency": tour_data.currency,
+                        # executemany compiles the INSERT from the first
+                        # row's keys, so every row must carry the same set
+                        "price_change": None,
+                        "price_change_percent": None,
+                    }
+                )
+                continue
+
+            stats["tours_updated"] += 1
+            if old_price == tour_data.price:
+                continue
+
+            stats["price_changes"] += 1
             price_change = tour_data.price - old_price
             price_change_percent = (
-                (price_change / old_price * 100) if old_price > 0 else Decimal(0)
+                (price_change / old_price * _D100) if old_price > _D0 else _D0
             )
-
-            # Add price history record
-            price_record = PriceHistory(
-                tour_id=existing_tour.id,
-                price=tour_data.price,
-                currency=tour_data.currency,
-                price_change=price_change,
-                price_change_percent=price_change_percent,
+            price_rows.append(
+                {
+                    "tour_id": tour_id,
+                    "price": tour_data.price,
+                    "currency": tour_data.currency,
+                    "price_change": price_change,
+                    "price_change_percent": price_change_percent,
+                }
+            )
+            changed.append(
+                (tour_id, old_price, tour_data, price_change, price_change_percent)
             )
-            db.add(price_record)
 
-            # Update price statistics
-            await self._update_price_stats(existing_tour.id, db)
+        if changed:
+            # All changed tours' statistics fold in with one UPDATE
+            await self._update_price_stats_bulk(
+                [(tour_id, tour_data.price) for tour_id, _, tour_data, _, _ in changed],
+                db,
+            )
 
+        for tour_id, old_price, tour_data, price_change, price_change_percent in changed:
             # Check and trigger alerts for this price change
             from src.services.alert_service import alert_service
             await alert_service.check_alerts_for_tour(
-                tour_id=existing_tour.id,
+                tour_id=tour_id,
                 old_price=old_price,
                 new_price=tour_data.price,
                 db=db,
             )
 
             logger.info(
-                f"Price changed for tour {existing_tour.id}",
-                tour_name=existing_tour.name[:50],
+                f"Price changed for tour {tour_id}",
+                tour_name=tour_data.name[:50],
                 old_price=float(old_price),
                 new_price=float(tour_data.price),
                 change=float(price_change),
                 change_percent=float(price_change_percent),
             )
 
-            return "price_changed"
-
-        return "updated"
+        for start in range(0, len(price_rows), self.INSERT_BATCH_SIZE):
+            await db.execute(
+                insert(PriceHistory),
+                price_rows[start : start + self.INSERT_BATCH_SIZE],
+            )
 
-    async def _update_price_stats(
+    async def _update_price_stats_bulk(
         self,
-        tour_id: int,
+        changed_prices: list[tuple[int, Decimal]],
         db: AsyncSession,
     ) -> None:
-        """Update min/max/avg price statistics for a tour."""
-        stats_query = select(
-            func.min(PriceHistory.price).label("min_price"),
-            func.max(PriceHistory.price).label("max_price"),
-            func.avg(PriceHistory.price).label("avg_price"),
-        ).where(PriceHistory.tour_id == tour_id)
+        """Fold new prices into the tours' min/max/avg statistics.
 
-        result = await db.execute(stats_query)
-        stats = result.one()
+        O(1) arithmetic on the stored aggregates instead of
+        re-scanning each tour's ever-growing price history, and a
+        single UPDATE ... FROM (VALUES ...) covers every changed tour
+        in the destination rather than one statement per tour.
+        """
+        incoming = values(
+            column("tour_id", Integer),
+            column("new_price", Numeric(10, 2)),
+            name="incoming",
+        ).data(changed_prices)
 
+        new_price = incoming.c.new_price
         await db.execute(
             update(Tour)
-            .where(Tour.id == tour_id)
+            .where(Tour.id == incoming.c.tour_id)
             .values(
-                min_price=stats.min_price,
-                max_price=stats.max_price,
-                avg_price=stats.avg_price,
+                min_price=func.least(
+                    func.coalesce(Tour.min_price, new_price), new_price
+                ),
+                max_price=func.greatest(
+                    func.coalesce(Tour.max_price, new_price), new_price
+                ),
+                avg_price=(
+                    func.coalesce(Tour.avg_price, new_price) * Tour.price_sample_count
+                    + new_price
+                )
+                / (Tour.price_sample_count + 1),
+                price_sample_count=Tour.price_sample_count + 1,
             )
         )
 
@@ -246,16 +309,33 @@ class PriceSyncService:
             destinations=len(self._destinations),
         )
 
-        async with AsyncSessionLocal() as db:
-            for destination in self._destinations:
-                stats = await self.sync_destination(destination, db)
-                overall_stats["destination_stats"].append(stats)
-                overall_stats["destinations_synced"] += 1
-                overall_stats["total_tours_found"] += stats["tours_found"]
-                overall_stats["total_tours_created"] += stats["tours_created"]
-                overall_stats["total_tours_updated"] += stats["tours_updated"]
-                overall_stats["total_price_changes"] += stats["price_changes"]
-                overall_stats["total_errors"] += stats["errors"]
+        # Destinations sync concurrently, each on its own session so
+        # commits don't contend; the scraper's rate limiter still
+        # paces outbound requests globally
+        sem = asyncio.BoundedSemaphore(settings.sync_concurrency)
+
+        async def sync_one(destination: str) -> dict:
+            async with sem:
+                async with BackgroundSessionLocal() as db:
+                    return await self.sync_destination(destination, db)
+
+        results = await asyncio.gather(
+            *(sync_one(destination) for destination in self._destinations),
+            return_exceptions=True,
+        )
+
+        for destination, stats in zip(self._destinations, results):
+            if isinstance(stats, Exception):
+                logger.error(f"Error syncing destination {destination}: {stats}")
+                overall_stats["total_errors"] += 1
+                continue
+            overall_stats["destination_stats"].append(stats)
+            overall_stats["destinations_synced"] += 1
+            overall_stats["total_tours_found"] += stats["tours_found"]
+            overall_stats["total_tours_created"] += stats["tours_created"]
+            overall_stats["total_tours_updated"] += stats["tours_updated"]
+            overall_stats["total_price_changes"] += stats["price_changes"]
+            overall_stats["total_errors"] += stats["errors"]
 
         overall_stats["finished_at"] = datetime.now(timezone.utc).isoformat()
 
@@ -291,26 +371,40 @@ class PriceSyncService:
 
         logger.info("Starting active tours price sync")
 
-        async with AsyncSessionLocal() as db:
-            # Get all active tours grouped by destination
+        # One query loads every active tour's id and destination; the
+        # per-destination syncs then filter to this set instead of
+        # upserting whatever else the listing pages happen to show
+        async with BackgroundSessionLocal() as db:
             result = await db.execute(
-                select(Tour.destination)
+                select(Tour.civitatis_id, Tour.destination)
                 .where(Tour.is_active == True)  # noqa: E712
                 .where(Tour.destination.isnot(None))
-                .distinct()
             )
-            destinations = [r[0] for r in result.all()]
-
-            for destination in destinations:
-                try:
-                    dest_stats = await self.sync_destination(destination.lower(), db)
-                    stats["tours_checked"] += dest_stats["tours_found"]
-                    stats["tours_updated"] += dest_stats["tours_updated"]
-                    stats["price_changes"] += dest_stats["price_changes"]
-                    stats["errors"] += dest_stats["errors"]
-                except Exception as e:
-                    logger.error(f"Error syncing destination {destination}: {e}")
-                    stats["errors"] += 1
+            active_by_dest: dict[str, set[int]] = {}
+            for civitatis_id, destination in result.all():
+                active_by_dest.setdefault(destination.lower(), set()).add(civitatis_id)
+
+        sem = asyncio.BoundedSemaphore(settings.sync_concurrency)
+
+        async def sync_one(destination: str, cids: set[int]) -> dict:
+            async with sem:
+                async with BackgroundSessionLocal() as db:
+                    return await self.sync_destination(destination, db, only_cids=cids)
+
+        results = await asyncio.gather(
+            *(sync_one(destination, cids) for destination, cids in active_by_dest.items()),
+            return_exceptions=True,
+        )
+
+        for destination, dest_stats in zip(active_by_dest, results):
+            if isinstance(dest_stats, Exception):
+                logger.error(f"Error syncing destination {destination}: {dest_stats}")
+                stats["errors"] += 1
+                continue
+            stats["tours_checked"] += dest_stats["tours_found"]
+            stats["tours_updated"] += dest_stats["tours_updated"]
+            stats["price_changes"] += dest_stats["price_changes"]
+            stats["errors"] += dest_stats["errors"]
 
         stats["finished_at"] = datetime.now(timezone.utc).isoformat()
 
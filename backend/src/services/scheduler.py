@@ -12,7 +12,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 from sqlalchemy import delete, select
 
 from src.core.config import get_settings
-from src.core.database import AsyncSessionLocal
+from src.core.database import BackgroundSessionLocal
 from src.models import PriceHistory
 from src.services.price_sync import price_sync_service
 from src.utils.logger import get_logger
@@ -101,23 +101,18 @@ class SchedulerService:
                 days=settings.cleanup_days_to_keep
             )
 
-            async with AsyncSessionLocal() as db:
-                # Count records to delete
-                count_query = select(PriceHistory.id).where(
-                    PriceHistory.recorded_at < cutoff_date
+            async with BackgroundSessionLocal() as db:
+                # Single DELETE; rowcount gives the count without
+                # pulling every doomed PK into Python first
+                result = await db.execute(
+                    delete(PriceHistory).where(
+                        PriceHistory.recorded_at < cutoff_date
+                    )
                 )
-                result = await db.execute(count_query)
-                count = len(result.all())
+                count = result.rowcount
+                await db.commit()
 
                 if count > 0:
-                    # Delete old records
-                    await db.execute(
-                        delete(PriceHistory).where(
-                            PriceHistory.recorded_at < cutoff_date
-                        )
-                    )
-                    await db.commit()
-
                     logger.info(
                         "Cleanup completed",
                         records_deleted=count,
@@ -165,7 +160,7 @@ scheduler_service = SchedulerService()
 
 async def run_initial_sync() -> None:
     """Run an initial price sync on startup if database is empty."""
-    async with AsyncSessionLocal() as db:
+    async with BackgroundSessionLocal() as db:
         from src.models import Tour
         result = await db.execute(select(Tour.id).limit(1))
         if result.scalar_one_or_none() is None:
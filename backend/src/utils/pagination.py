@@ -0,0 +1,27 @@
+"""Keyset (cursor) pagination helpers.
+
+Encodes the (timestamp, id) position of the last row of a page as an
+opaque token. Resuming from the token costs O(page_size) regardless of
+how deep the client has paged, unlike OFFSET which scans and discards
+every preceding row.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+
+def encode_cursor(ts: datetime, row_id: int) -> str:
+    """Encode a (timestamp, id) page boundary as an opaque token."""
+    raw = f"{ts.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int] | None:
+    """Decode a cursor token; returns None if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts_str, id_str = raw.rsplit("|", 1)
+        return datetime.fromisoformat(ts_str), int(id_str)
+    except (ValueError, binascii.Error, UnicodeDecodeError):
+        return None
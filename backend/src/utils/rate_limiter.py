@@ -18,25 +18,26 @@ class RateLimiter:
 
     def __init__(self, min_delay_seconds: float = 30.0):
         self.min_delay_seconds = min_delay_seconds
-        self._last_request_time: float = 0
-        self._lock = asyncio.Lock()
+        self._next_slot: float = 0.0
         self._request_count = 0
 
     async def acquire(self) -> None:
         """
         Acquire permission to make a request.
         Will wait if necessary to respect the rate limit.
-        """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self._last_request_time
 
-            if elapsed < self.min_delay_seconds and self._last_request_time > 0:
-                wait_time = self.min_delay_seconds - elapsed
-                await asyncio.sleep(wait_time)
+        Each caller claims the next start slot in one non-awaiting
+        read-modify-write (atomic under cooperative scheduling) and
+        sleeps until its slot, so concurrent callers space out their
+        starts instead of queuing behind a lock held across the sleep.
+        """
+        now = time.monotonic()
+        wait_time = self._next_slot - now
+        self._next_slot = max(now, self._next_slot) + self.min_delay_seconds
+        self._request_count += 1
 
-            self._last_request_time = time.time()
-            self._request_count += 1
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     @property
     def request_count(self) -> int:
@@ -45,7 +46,7 @@ class RateLimiter:
 
     def reset(self) -> None:
         """Reset the rate limiter state."""
-        self._last_request_time = 0
+        self._next_slot = 0.0
         self._request_count = 0
 
 